@@ -0,0 +1,33 @@
+"""
+    File: __init__.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: 8 Ball Pool game, physics engines and tools. Importing the package imports nothing else, each module
+                 is only imported when it is first used (e.g. eightball.physics), so worker processes that only need
+                 the physics never import pygame or set up the display
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import importlib
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+__version__ = '1.1.0'
+# modules of the package that can be reached as attributes of the package
+__all__ = ['ai', 'aim_guide', 'assets', 'audio', 'batch', 'batch_engine', 'benchmark', 'broadphase', 'cli',
+           'common', 'cue_cache', 'event_engine', 'export', 'game', 'physics', 'profiler', 'recording', 'renderer',
+           'rules', 'scheduler', 'server', 'shot_cache', 'table_state', 'tournament']
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function imports a module of the package the first time it is used as an attribute of the package
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
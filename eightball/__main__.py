@@ -0,0 +1,10 @@
+"""
+    File: __main__.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Runs the command line entry point when the package is run with python -m eightball
+"""
+from .cli import main
+
+main()
@@ -0,0 +1,186 @@
+"""
+    File: ai.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: A computer controlled opponent. Each turn it samples candidate shots, simulates them in worker
+                 processes without rendering, scores each outcome with the turn rules of the game and picks the best
+                 shot found within a time budget. The search runs on a background thread so the game keeps drawing
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import multiprocessing
+import random
+import threading
+import time
+import traceback
+from .physics import strike_speed, coordinates_to_angle, touching_other_ball
+from .table_state import TableState
+from .rules import resolve_turn
+from .shot_cache import cached_engine
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# scores given to the outcomes of a shot
+WIN_SCORE = 1000
+LOSS_SCORE = -1000
+FOUL_SCORE = -50
+OWN_BALL_SCORE = 20
+OPPONENT_BALL_SCORE = -10
+# range of strike distances sampled (the game caps the strike distance at 210)
+MIN_STRIKE_DISTANCE = 30
+MAX_STRIKE_DISTANCE = 210
+# random variation added to the directions of aimed candidates, in degrees
+AIM_SPREAD = 4
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function simulates a list of candidate shots in a worker process
+# shots already simulated by the process are looked up in its shot cache, kept in shot_cache_path if it is given
+# returns a list of (cue_direction, strike_distance, shot result) tuples
+def evaluate_candidates(table_state, engine, candidates, shot_cache_path=None):
+    simulate_shot = cached_engine(engine, shot_cache_path)
+    results = []
+    for cue_direction, strike_distance in candidates:
+        results.append((cue_direction, strike_distance,
+                        simulate_shot(table_state, cue_direction, strike_speed(strike_distance))))
+    return results
+
+
+# function scores the outcome of a shot for the player taking it, resolving the turn with the rules of the game
+# game is the state of the game before the shot and colours are the colours of the balls
+def score_shot(result, colours, game):
+    player = game.player_turn
+    new_game = resolve_turn(game, result.potted, result.first_ball_hit, colours)[0]
+    # the eight ball ends the game
+    if new_game.winner is not None:
+        return WIN_SCORE if new_game.winner == player else LOSS_SCORE
+    score = 0
+    # fouls give the opponent the ball in hand
+    if new_game.cue_ball_in_hand:
+        score += FOUL_SCORE
+    # the colours may have been assigned by the shot
+    colour = new_game.colour(player)
+    for i in result.potted:
+        if i == 0:
+            continue
+        if colours[i] == colour:
+            score += OWN_BALL_SCORE
+        elif colours[i] in ('stripes', 'solids'):
+            score += OPPONENT_BALL_SCORE
+    return score
+
+
+# function returns candidate shots for the player
+# half of the candidates are aimed at the balls the player may hit first, the rest are random
+def sample_candidates(table_state, game, count):
+    cue_ball = table_state[0]
+    target = game.target()
+    targets = [b for b in table_state[1:] if not b.potted and (target is None or b.colour == target)]
+    candidates = []
+    for i in range(count):
+        if targets and i % 2 == 0:
+            b = random.choice(targets)
+            cue_direction = coordinates_to_angle(cue_ball.x, cue_ball.y, b.x, b.y) + random.uniform(-AIM_SPREAD, AIM_SPREAD)
+            cue_direction %= 360
+        else:
+            cue_direction = random.uniform(0, 360)
+        candidates.append((cue_direction, random.uniform(MIN_STRIKE_DISTANCE, MAX_STRIKE_DISTANCE)))
+    return candidates
+
+
+# function returns coordinates for the cue ball when the computer has the ball in hand
+# searches outwards from the starting spot of the cue ball for the first position that is clear of the other balls
+def place_cue_ball(balls, cue_ball):
+    for distance in range(0, 400, 10):
+        for x, y in ((550 - distance, 400), (550 + distance, 400), (550, 400 - distance), (550, 400 + distance)):
+            if 210 < x < 1190 and 160 < y < 640:
+                if not touching_other_ball(x, y, cue_ball, balls):
+                    return x, y
+    return cue_ball.x, cue_ball.y
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# computer controlled player that searches for its shot on a background thread
+class MonteCarloPlayer (object):
+    def __init__(self, time_budget=0.2, processes=None, engine='step', chunk_size=8):
+        # seconds the computer may spend choosing each shot
+        self.time_budget = time_budget
+        self.processes = processes or multiprocessing.cpu_count()
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.pool = None
+        self.thread = None
+        # best shot found in the current turn as (cue_direction, strike_distance), None while still searching
+        self.choice = None
+        # number of candidate shots evaluated in the last turn
+        self.evaluated = 0
+
+    # shuts down the worker processes
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    # function starts searching for a shot from the given balls without blocking
+    # game is the state of the game, the computer plays as the player whose turn it is
+    def start_turn(self, balls, game):
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.processes)
+        self.choice = None
+        # the search works on a compact copy of the balls so that the game can keep drawing the real ones
+        # and the copy is cheap to send to the worker processes
+        table_state = TableState(balls)
+        self.thread = threading.Thread(target=self.search, args=(table_state, game))
+        self.thread.daemon = True
+        self.thread.start()
+
+    # function returns whether the search for the current turn has finished
+    def ready(self):
+        return self.choice is not None
+
+    # searches for a shot and stores it as the choice of the turn
+    # if the search fails a random candidate is chosen, so that the game never waits for a choice that never comes
+    def search(self, table_state, game):
+        try:
+            self.choice = self.find_shot(table_state, game)
+        except Exception:
+            traceback.print_exc()
+            self.choice = sample_candidates(table_state, game, 1)[0]
+
+    # function searches candidate shots until the time budget runs out and returns the best one
+    def find_shot(self, table_state, game):
+        deadline = time.time() + self.time_budget
+        colours = table_state.colours
+        pending = []
+        best, best_score = None, None
+        self.evaluated = 0
+        while True:
+            # keeps two chunks queued for each worker process until the time runs out
+            # a chunk is always queued while no shot has been found, even once the time is up
+            while (time.time() < deadline or (best is None and not pending)) and len(pending) < self.processes * 2:
+                candidates = sample_candidates(table_state, game, self.chunk_size)
+                pending.append(self.pool.apply_async(evaluate_candidates, (table_state, self.engine, candidates)))
+            finished = [p for p in pending if p.ready()]
+            # always waits for at least one chunk so that a shot is chosen even with a tiny budget
+            if not finished and (time.time() < deadline or best is None):
+                pending[0].wait(0.005)
+                continue
+            for p in finished:
+                pending.remove(p)
+                for cue_direction, strike_distance, result in p.get():
+                    self.evaluated += 1
+                    score = score_shot(result, colours, game)
+                    if best_score is None or score > best_score:
+                        best, best_score = (cue_direction, strike_distance), score
+            if time.time() >= deadline and best is not None:
+                return best
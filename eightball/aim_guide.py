@@ -0,0 +1,141 @@
+"""
+    File: aim_guide.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Predicted path of the cue ball shown while aiming. Only the cue ball is moved, with the same substeps,
+                 cushion bounces and friction as the physics engine, and the prediction stops as soon as it reaches the
+                 first object ball, a pocket or the last shown bounce. Paths are cached by the aim angle and strike
+                 power rounded to a set resolution, and the cache is only cleared when the balls on the table move
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import math
+from collections import OrderedDict
+from .physics import angle_to_coordinates, collision_with_wall, ball_collision_physics, ball_potted, \
+    distance_between_points
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# number of cushion bounces shown before the prediction stops
+MAX_BOUNCES = 3
+# length in pixels of the lines showing where the balls go after the first collision, for each unit of speed
+DEFLECTION_LENGTH = 6
+# colours of the guide
+PATH_COLOUR = (255, 255, 255)
+DEFLECTION_COLOUR = (255, 255, 0)
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# predicted path of the cue ball for one aim
+class PredictedPath (object):
+    def __init__(self, points, contact=None, cue_deflection=None, ball_deflection=None, potted=False):
+        # the start of the path, every cushion bounce and the end of the path
+        self.points = points
+        # index of the first object ball the cue ball reaches (None if it reaches no ball)
+        self.contact = contact
+        # directions and speeds of the cue ball and the object ball after the collision as (angle, speed) tuples
+        self.cue_deflection = cue_deflection
+        self.ball_deflection = ball_deflection
+        # whether the cue ball falls into a pocket before reaching a ball
+        self.potted = potted
+
+
+# predicts the path of the cue ball, keeping the paths of recent aims
+class AimGuide (object):
+    def __init__(self, resolution=0.25, max_paths=512, max_bounces=MAX_BOUNCES):
+        self.resolution = resolution
+        self.steps = int(round(360 / resolution))
+        self.max_paths = max_paths
+        self.max_bounces = max_bounces
+        # paths in least to most recently used order keyed by (angle key, power)
+        self.paths = OrderedDict()
+        # positions of the balls the cached paths were predicted with
+        self.layout = None
+        self.hits = 0
+        self.misses = 0
+
+    # function returns the cache key of an angle
+    def key(self, angle):
+        return int(round((angle % 360) / self.resolution)) % self.steps
+
+    # function returns the predicted path for the given aim, predicting it only if it is not cached
+    # balls is the list of balls (cue ball first) and power is the speed the cue ball is struck with
+    def get(self, balls, angle, power):
+        layout = tuple((b.x, b.y, b.potted) for b in balls)
+        if layout != self.layout:
+            self.layout = layout
+            self.paths.clear()
+        key = (self.key(angle), power)
+        path = self.paths.get(key)
+        if path is not None:
+            self.hits += 1
+            self.paths.move_to_end(key)
+            return path
+        self.misses += 1
+        path = predict_path(balls, key[0] * self.resolution, power, self.max_bounces)
+        self.paths[key] = path
+        if len(self.paths) > self.max_paths:
+            self.paths.popitem(last=False)
+        return path
+
+    # draws a path with the renderer: the path of the cue ball, the cue ball where it reaches the object ball
+    # and the directions both balls take after the collision
+    def draw(self, renderer, path):
+        for i in range(len(path.points) - 1):
+            renderer.line(PATH_COLOUR, path.points[i], path.points[i + 1], 2)
+        end = path.points[-1]
+        if path.contact is not None:
+            renderer.circle(PATH_COLOUR, (int(end[0]), int(end[1])), 10, 1)
+            for angle, speed in (path.cue_deflection, path.ball_deflection):
+                renderer.line(DEFLECTION_COLOUR, end, angle_to_coordinates(end[0], end[1], angle,
+                                                                          10 + speed * DEFLECTION_LENGTH), 1)
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function moves the cue ball alone frame by frame like advance_frame, with the other balls standing still
+# stops at the first object ball, a pocket, the last bounce shown or when the cue ball comes to rest
+# returns the predicted path
+def predict_path(balls, angle, power, max_bounces=MAX_BOUNCES):
+    cue_ball = balls[0]
+    others = [b for b in balls[1:] if not b.potted]
+    x, y = cue_ball.x, cue_ball.y
+    speed, frames = power, cue_ball.frames
+    points = [(x, y)]
+    bounces = 0
+    while speed > 0:
+        for i in range(int(speed)):
+            if y - 10 <= 150 or y + 10 >= 650 or x + 10 >= 1200 or x - 10 <= 200:
+                if speed > 1:
+                    speed -= 1
+                new_angle = collision_with_wall(x, y, angle)
+                if new_angle is not None:
+                    angle = new_angle
+                    points.append((x, y))
+                    bounces += 1
+                    if bounces > max_bounces:
+                        return PredictedPath(points)
+            x, y = angle_to_coordinates(x, y, angle, 1)
+        if ball_potted(x, y):
+            points.append((x, y))
+            return PredictedPath(points, potted=True)
+        # the balls are compared like check_collision_with_other_ball, the first one in the list is hit
+        for b in others:
+            if b.x != x and b.y != y and distance_between_points(x, y, b.x, b.y) <= 20:
+                points.append((x, y))
+                cue_angle, ball_angle, cue_speed, ball_speed = ball_collision_physics(x, y, b.x, b.y, angle, speed)
+                return PredictedPath(points, balls.index(b), (cue_angle, cue_speed), (ball_angle, ball_speed))
+        if frames >= (-30) * math.log10(0.05 * (speed + 1)):
+            speed -= 1
+            frames = 0
+        frames += 1
+    points.append((x, y))
+    return PredictedPath(points)
@@ -0,0 +1,116 @@
+"""
+    File: assets.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Loads the images and sounds of the game. Each asset is loaded once and converted to the pixel format
+                 of the display, the ball sprites are packed into a single atlas, sounds are only decoded the first
+                 time they are played, and the time taken to load each asset is recorded
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import os
+import time
+from collections import OrderedDict
+import pygame
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# folder containing the images and sounds folders
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+# number of ball sprites and the size of each sprite
+NUMBER_OF_BALLS = 16
+BALL_SIZE = 20
+# frequency, sample size, channels and buffer size the mixer is started with
+MIXER_SETTINGS = (44100, 16, 2, 4096)
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# sound that is loaded the first time it is played
+class LazySound (object):
+    def __init__(self, assets, name):
+        self.assets = assets
+        self.name = name
+        self.sound = None
+
+    # function returns the loaded sound, loading it if it has not been loaded yet
+    # the mixer is started with the first sound loaded
+    def load(self):
+        if self.sound is None:
+            if pygame.mixer.get_init() is None:
+                pygame.mixer.init(*MIXER_SETTINGS)
+            self.sound = self.assets.timed(self.name, lambda: pygame.mixer.Sound(self.assets.path(self.name)))
+        return self.sound
+
+
+# loads and stores every image and sound used by the game
+class AssetManager (object):
+    def __init__(self, root=ASSET_DIR):
+        self.root = root
+        self.images = {}
+        self.sounds = {}
+        # surface holding every ball sprite side by side and the sprites cut out of it
+        self.atlas = None
+        self.ball_sprites = None
+        # seconds taken to load each asset in the order they were loaded
+        self.load_times = OrderedDict()
+
+    # function returns the full path of an asset
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    # function calls load, records the time it took under the given name and returns the loaded asset
+    def timed(self, name, load):
+        start = time.perf_counter()
+        asset = load()
+        self.load_times[name] = time.perf_counter() - start
+        return asset
+
+    # function loads an image from disk, converting it to the pixel format of the display if one is open
+    def load_image(self, name):
+        image = pygame.image.load(self.path(name))
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        return image
+
+    # function returns an image, loading it the first time it is used
+    def image(self, name):
+        if name not in self.images:
+            self.images[name] = self.timed(name, lambda: self.load_image(name))
+        return self.images[name]
+
+    # packs the sprites of all of the balls into a single surface
+    def build_atlas(self):
+        atlas = pygame.Surface((BALL_SIZE * NUMBER_OF_BALLS, BALL_SIZE), pygame.SRCALPHA)
+        for number in range(NUMBER_OF_BALLS):
+            atlas.blit(pygame.image.load(self.path('images/ball' + str(number) + '.png')), (number * BALL_SIZE, 0))
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        self.atlas = atlas
+        self.ball_sprites = [atlas.subsurface((number * BALL_SIZE, 0, BALL_SIZE, BALL_SIZE))
+                             for number in range(NUMBER_OF_BALLS)]
+
+    # function returns the sprite of the ball with the given number (0 is the cue ball)
+    def ball_sprite(self, number):
+        if self.ball_sprites is None:
+            self.timed('ball atlas', self.build_atlas)
+        return self.ball_sprites[number]
+
+    # function returns a sound that is loaded the first time it is played
+    def sound(self, name):
+        if name not in self.sounds:
+            self.sounds[name] = LazySound(self, name)
+        return self.sounds[name]
+
+    # function returns the load times of the assets as lines of text, along with the total
+    def report(self):
+        lines = []
+        for name in self.load_times:
+            lines.append('%-20s %8.2f ms' % (name, self.load_times[name] * 1000))
+        lines.append('%-20s %8.2f ms' % ('total', sum(self.load_times.values()) * 1000))
+        return lines
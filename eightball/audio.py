@@ -0,0 +1,86 @@
+"""
+    File: audio.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Plays the sound effects of the game from the events of the physics engine. Sounds are queued during
+                 the frame and played together once the frame is drawn, so that a ball touching a wall on several
+                 steps of the same frame is heard once and the sounds line up with the screen. The volume of each
+                 sound follows the speed of the impact, sounds are played on a limited number of mixer channels,
+                 and the mixer can be started with a small buffer for lower latency
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import pygame
+from .assets import MIXER_SETTINGS
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# mixer settings with a buffer of 512 samples (about 12 ms at 44100 Hz instead of about 93 ms)
+LOW_LATENCY_MIXER_SETTINGS = MIXER_SETTINGS[:3] + (512,)
+# number of mixer channels, when every channel is busy the sound that has played the longest is cut off
+CHANNELS = 8
+# speed (in pixels per step) of an impact that is played at full volume
+FULL_VOLUME_SPEED = 15
+# file of each kind of sound and the volume of the sound at the slowest speed
+SOUNDS = {'hit': ('sounds/hit.wav', 0.1), 'pot': ('sounds/sunk.ogg', 1.0), 'strike': ('sounds/strike.wav', 0.2)}
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# queues the sounds of each frame and plays them on a pool of mixer channels once the frame is drawn
+class AudioScheduler (object):
+    def __init__(self, assets, channels=CHANNELS, low_latency=False):
+        self.sounds = dict((kind, assets.sound(SOUNDS[kind][0])) for kind in SOUNDS)
+        self.channels = channels
+        self.settings = LOW_LATENCY_MIXER_SETTINGS if low_latency else MIXER_SETTINGS
+        # fastest speed of each kind of sound queued this frame
+        self.queued = {}
+        # number of sounds queued and played, the difference is the number merged with another sound of the frame
+        self.requests = 0
+        self.played = 0
+
+    # adds a sound to the frame, sounds of the same kind in a frame are played once at the volume of the fastest
+    def queue(self, kind, speed):
+        self.requests += 1
+        if speed > self.queued.get(kind, -1):
+            self.queued[kind] = speed
+
+    # queues the sounds of the events of a physics step
+    # the speed of an impact is taken as the speed of the fastest ball involved after the step
+    def queue_events(self, events, balls):
+        for event in events:
+            if event[0] == 'pot':
+                self.queue('pot', balls[event[1]].speed)
+            elif event[0] == 'wall':
+                self.queue('hit', balls[event[1]].speed)
+            else:
+                self.queue('hit', max(balls[event[1]].speed, balls[event[2]].speed))
+
+    # starts the mixer with the chosen settings and number of channels if it has not been started yet
+    def start(self):
+        if pygame.mixer.get_init() is None:
+            pygame.mixer.init(*self.settings)
+            pygame.mixer.set_num_channels(self.channels)
+
+    # function returns the volume of a kind of sound at the given speed
+    def volume(self, kind, speed):
+        quietest = SOUNDS[kind][1]
+        return quietest + (1 - quietest) * min(max(speed / FULL_VOLUME_SPEED, 0), 1)
+
+    # plays the sounds queued this frame, called once per frame when the frame is drawn
+    def flush(self):
+        if not self.queued:
+            return
+        self.start()
+        for kind in self.queued:
+            channel = pygame.mixer.find_channel(True)
+            if channel is not None:
+                channel.set_volume(self.volume(kind, self.queued[kind]))
+                channel.play(self.sounds[kind].load())
+                self.played += 1
+        self.queued = {}
@@ -0,0 +1,99 @@
+"""
+    File: batch.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Evaluates large numbers of candidate shots from a single table state in parallel. The table state is
+                 sent to each worker process once, shots are dispatched in chunks and the outcomes are streamed back
+                 as soon as each chunk finishes
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import multiprocessing
+from .physics import strike_speed
+from .table_state import TableState
+from .shot_cache import cached_engine
+
+# ==================================================================================================================
+# WORKER PROCESS STATE
+# ==================================================================================================================
+# table state and shot cache of the engine used by a worker process, set once when the worker starts
+worker_table = None
+worker_simulate_shot = None
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function run once in each worker process to store the table state and engine it evaluates shots with
+def init_worker(table_state, engine):
+    global worker_table, worker_simulate_shot
+    worker_table = table_state
+    worker_simulate_shot = cached_engine(engine)
+
+
+# function simulates a chunk of shots in a worker process
+# each shot is an (index, cue_direction, strike_distance) tuple, returns a list of (index, shot result) tuples
+def evaluate_chunk(chunk):
+    results = []
+    for index, cue_direction, strike_distance in chunk:
+        results.append((index, worker_simulate_shot(worker_table, cue_direction, strike_speed(strike_distance))))
+    return results
+
+
+# function splits the (cue_direction, strike_distance) pairs into chunks of numbered shots
+# shots are read lazily so that very large generators of shots can be evaluated
+def chunk_shots(shots, chunk_size):
+    chunk = []
+    for index, (cue_direction, strike_distance) in enumerate(shots):
+        chunk.append((index, cue_direction, strike_distance))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# pool of worker processes that evaluate candidate shots from one table state
+class ShotEvaluator (object):
+    def __init__(self, table_state, engine='step', processes=None, chunk_size=64):
+        # compact copy of the balls without sprites, so that it can be sent to the workers
+        if isinstance(table_state, TableState):
+            self.table_state = table_state.clone()
+        else:
+            self.table_state = TableState(table_state)
+        self.chunk_size = chunk_size
+        self.pool = multiprocessing.Pool(processes, init_worker, (self.table_state, engine))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # shuts down the worker processes
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    # function evaluates the given (cue_direction, strike_distance) pairs
+    # yields (index of the shot, shot result) tuples in the order the chunks finish
+    def evaluate(self, shots):
+        for results in self.pool.imap_unordered(evaluate_chunk, chunk_shots(shots, self.chunk_size)):
+            for result in results:
+                yield result
+
+    # function evaluates the given (cue_direction, strike_distance) pairs
+    # returns the shot results in the same order as the shots
+    def evaluate_all(self, shots):
+        shots = list(shots)
+        results = [None] * len(shots)
+        for index, result in self.evaluate(shots):
+            results[index] = result
+        return results
@@ -0,0 +1,283 @@
+"""
+    File: benchmark.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Benchmark suite for the physics engines and the renderer. Runs a fixed set of shots from the initial
+                 rack (the break, rail to rail shots, shots off many cushions and crowded clusters) and reports the
+                 physics steps per second (of the engines that step every frame), shots per second, frame times, the
+                 import time of each engine and peak memory. Results are written as JSON so that runs can be compared
+                 to catch performance regressions
+                 Usage: python -m eightball benchmark [--engine step|event|batch|all] [--repeat N]
+                                                      [--output FILE] [--compare FILE] [--no-render]
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import os
+import sys
+import json
+import time
+import random
+import platform
+import subprocess
+import tracemalloc
+from . import physics
+from .common import option, percentile
+from .physics import RACK, racked_balls, advance_frame, balls_stopped, strike_speed, copy_balls, get_engine, ENGINES
+from .broadphase import CollisionTracker
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# seed used for every random shot so that runs are reproducible
+SEED = 8
+# number of times each scenario is run by default
+REPEAT = 5
+# a scenario counts as a regression when it is this much slower than in the compared results
+REGRESSION_THRESHOLD = 0.1
+# the hardest strike the player can make
+FULL_POWER = strike_speed(210)
+# engines that jump from one event to the next instead of stepping every frame, their steps per second are not
+# reported since the number of frames in a shot says nothing about the work done to simulate it
+EVENT_ENGINES = ('event',)
+# program run in a fresh interpreter to time the import of an engine module, printing the seconds taken
+IMPORT_TIMER = 'import time, importlib; start = time.perf_counter(); importlib.import_module(%r); ' \
+               'print(time.perf_counter() - start)'
+
+# ==================================================================================================================
+# SCENARIOS
+# ==================================================================================================================
+# every scenario returns a list of (table_state, direction, power) shots
+
+
+# the opening break at full power
+def break_shots():
+    return [(racked_balls(), 0, FULL_POWER)]
+
+
+# long shots straight up, down and across the table that bounce between opposite rails
+def rail_to_rail_shots():
+    return [(racked_balls(), 90, FULL_POWER), (racked_balls(), 270, FULL_POWER), (racked_balls(), 180, FULL_POWER)]
+
+
+# the cue ball alone on the table, struck at shallow angles so that it comes off many cushions
+def cushion_shots():
+    shots = []
+    for direction in (17, 33, 61, 152):
+        table_state = racked_balls()
+        for b in table_state[1:]:
+            b.potted = True
+        shots.append((table_state, direction, FULL_POWER))
+    return shots
+
+
+# the cue ball starting against the rack, and every ball of the rack moving at once
+def cluster_shots():
+    table_state = racked_balls()
+    table_state[0].x = 925
+    shots = [(table_state, 0, FULL_POWER)]
+    rng = random.Random(SEED)
+    for i in range(3):
+        table_state = racked_balls()
+        for b in table_state[1:]:
+            b.speed = rng.randint(5, 15)
+            b.movement_direction = rng.uniform(0, 360)
+        shots.append((table_state, rng.uniform(0, 360), FULL_POWER))
+    return shots
+
+
+SCENARIOS = (('break', break_shots), ('rail_to_rail', rail_to_rail_shots), ('cushions', cushion_shots),
+             ('cluster', cluster_shots))
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function plays out a shot with the step engine, timing every frame
+# returns the number of frames and the time taken by each of them
+def timed_step_shot(table_state, direction, power):
+    balls = copy_balls(table_state)
+    balls[0].speed = power
+    balls[0].movement_direction = direction
+    tracker = CollisionTracker(balls)
+    frame_times = []
+    clock = time.perf_counter
+    while not balls_stopped(balls) and len(frame_times) < physics.MAX_SHOT_FRAMES:
+        start = clock()
+        advance_frame(balls, tracker)
+        frame_times.append(clock() - start)
+    return len(frame_times), frame_times
+
+
+# function runs the shots of a scenario with an engine the given number of times
+# returns the statistics of the run as a dictionary
+def run_scenario(engine, shots, repeat):
+    simulate_shot = get_engine(engine)
+    frames, shot_count, total_time, frame_times = 0, 0, 0.0, []
+    for i in range(repeat):
+        for table_state, direction, power in shots:
+            # the step engine is timed frame by frame, the others only by whole shots
+            if engine == 'step':
+                shot_frames, shot_frame_times = timed_step_shot(table_state, direction, power)
+                frame_times += shot_frame_times
+                total_time += sum(shot_frame_times)
+            else:
+                start = time.perf_counter()
+                shot_frames = simulate_shot(table_state, direction, power).frames
+                total_time += time.perf_counter() - start
+            frames += shot_frames
+            shot_count += 1
+    frame_times.sort()
+    stats = {'shots': shot_count, 'frames': frames, 'seconds': total_time,
+             'shots_per_second': shot_count / total_time if total_time else 0}
+    if engine not in EVENT_ENGINES:
+        stats['steps_per_second'] = frames / total_time if total_time else 0
+    if frame_times:
+        stats['mean_frame_ms'] = sum(frame_times) / len(frame_times) * 1000
+        stats['p99_frame_ms'] = percentile(frame_times, 0.99) * 1000
+    return stats
+
+
+# function returns the peak memory (in KiB) allocated while running the shots of a scenario once
+def peak_memory(engine, shots):
+    simulate_shot = get_engine(engine)
+    tracemalloc.start()
+    for table_state, direction, power in shots:
+        simulate_shot(table_state, direction, power)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+# function returns the seconds taken to import each engine module
+# each import is timed in a fresh interpreter, so the modules and libraries already imported by this process or by
+# another engine (such as NumPy for the batch engine) are not left out of the time, engines that fail to import are left out
+def engine_startup_times():
+    times = {}
+    # the package is found from the folder it is in, wherever the benchmark is started from
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] +
+        ([environment['PYTHONPATH']] if environment.get('PYTHONPATH') else []))
+    for name in sorted(ENGINES):
+        process = subprocess.run([sys.executable, '-c', IMPORT_TIMER % (__package__ + '.' + ENGINES[name])],
+                                 capture_output=True, text=True, env=environment)
+        if process.returncode == 0:
+            times[name] = float(process.stdout)
+    return times
+
+
+# function benchmarks the game frame: physics, drawing the balls and updating the display through the renderer
+# uses a hidden display so no window is opened, returns the startup time and frame time statistics
+def run_render(repeat):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    from .assets import AssetManager
+    from .renderer import Renderer, WALLS
+    start = time.perf_counter()
+    pygame.init()
+    display = pygame.display.set_mode((1400, 800))
+    assets = AssetManager()
+    renderer = Renderer(display, pygame.font.SysFont('impact', 30), WALLS, physics.holes)
+    sprites = [assets.ball_sprite(n) for n in range(len(RACK))]
+    startup = time.perf_counter() - start
+    frame_times = []
+    for i in range(repeat):
+        balls = racked_balls()
+        balls[0].speed = FULL_POWER
+        tracker = CollisionTracker(balls)
+        while not balls_stopped(balls):
+            start = time.perf_counter()
+            advance_frame(balls, tracker)
+            renderer.set_background([('Player 1', (0, 0, 0), (50, 20))], [])
+            for n in range(len(balls)):
+                if not balls[n].potted:
+                    renderer.blit(sprites[n], (balls[n].x - 10, balls[n].y - 10))
+            renderer.update()
+            frame_times.append(time.perf_counter() - start)
+    pygame.quit()
+    frame_times.sort()
+    return {'startup_seconds': startup, 'frames': len(frame_times),
+            'mean_frame_ms': sum(frame_times) / len(frame_times) * 1000,
+            'p99_frame_ms': percentile(frame_times, 0.99) * 1000}
+
+
+# function compares results with earlier results, returning lines describing each scenario that got slower
+def regressions(results, baseline):
+    lines = []
+    for engine in results['engines']:
+        for name, stats in results['engines'][engine].items():
+            old = baseline.get('engines', {}).get(engine, {}).get(name)
+            # engines without steps per second are compared by their shots per second
+            if 'steps_per_second' in stats:
+                key, unit = 'steps_per_second', 'steps/s'
+            else:
+                key, unit = 'shots_per_second', 'shots/s'
+            if old and old.get(key) and stats[key] < old[key] * (1 - REGRESSION_THRESHOLD):
+                lines.append('%s %s: %.0f %s, was %.0f' % (engine, name, stats[key], unit, old[key]))
+    return lines
+
+
+# function runs the benchmarks and returns the results as a dictionary
+def run(engines, repeat, render=True):
+    results = {'python': platform.python_version(), 'platform': platform.platform(), 'repeat': repeat,
+               'startup_seconds': engine_startup_times(), 'engines': {}, 'peak_memory_kib': {}}
+    for engine in engines:
+        if engine not in results['startup_seconds']:
+            continue
+        # a first shot is run so that one time setup is not timed
+        get_engine(engine)(racked_balls(), 0, FULL_POWER)
+        results['engines'][engine] = {}
+        results['peak_memory_kib'][engine] = {}
+        for name, scenario in SCENARIOS:
+            shots = scenario()
+            results['engines'][engine][name] = run_scenario(engine, shots, repeat)
+            results['peak_memory_kib'][engine][name] = peak_memory(engine, shots)
+    if render:
+        results['render'] = run_render(repeat)
+    return results
+
+
+# prints the results as a table
+def report(results):
+    print('%-6s %-13s %8s %12s %10s %10s %10s %10s' % ('engine', 'scenario', 'shots', 'steps/s', 'shots/s',
+                                                       'mean ms', 'p99 ms', 'peak KiB'))
+    for engine in results['engines']:
+        for name, stats in results['engines'][engine].items():
+            print('%-6s %-13s %8d %12s %10.1f %10s %10s %10.1f' % (
+                engine, name, stats['shots'],
+                '%.0f' % stats['steps_per_second'] if 'steps_per_second' in stats else '-', stats['shots_per_second'],
+                '%.4f' % stats['mean_frame_ms'] if 'mean_frame_ms' in stats else '-',
+                '%.4f' % stats['p99_frame_ms'] if 'p99_frame_ms' in stats else '-',
+                results['peak_memory_kib'][engine][name]))
+    for engine, seconds in results['startup_seconds'].items():
+        print('%s engine import: %.2f ms' % (engine, seconds * 1000))
+    if 'render' in results:
+        render = results['render']
+        print('render: startup %.2f ms, %d frames, mean %.3f ms, p99 %.3f ms' % (
+            render['startup_seconds'] * 1000, render['frames'], render['mean_frame_ms'], render['p99_frame_ms']))
+
+
+def main():
+    engine = option('--engine', 'step')
+    engines = sorted(ENGINES) if engine == 'all' else [engine]
+    results = run(engines, int(option('--repeat', REPEAT)), '--no-render' not in sys.argv)
+    report(results)
+    output = option('--output')
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    compare = option('--compare')
+    if compare is not None:
+        with open(compare) as f:
+            slower = regressions(results, json.load(f))
+        for line in slower:
+            print('regression: ' + line)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
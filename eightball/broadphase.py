@@ -0,0 +1,72 @@
+"""
+    File: broadphase.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Keeps track of where every ball is on a uniform grid so that collision checks only look at the balls
+                 in neighbouring cells, and of which pairs of balls have just collided. Works for any number of balls
+"""
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# width of each grid cell, equal to the diameter of a ball so that touching balls are always in neighbouring cells
+CELL_SIZE = 20
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# uniform grid of the balls on the table together with the collision monitor of the balls
+class CollisionTracker (object):
+    def __init__(self, balls):
+        self.balls = balls
+        # position of each ball in the balls list
+        self.index = {}
+        # balls in each grid cell, keyed by the (column, row) of the cell
+        self.cells = {}
+        # cell that each ball is currently stored in
+        self.ball_cells = {}
+        # pairs of ball indices (lower index first) that may not collide again until the monitor is reset
+        self.monitor = set()
+        for i in range(len(balls)):
+            self.index[balls[i]] = i
+            self.update(balls[i])
+
+    # function moves a ball to the cell matching its current coordinates
+    def update(self, ball):
+        cell = (int(ball.x // CELL_SIZE), int(ball.y // CELL_SIZE))
+        old_cell = self.ball_cells.get(ball)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            self.cells[old_cell].remove(ball)
+            if not self.cells[old_cell]:
+                del self.cells[old_cell]
+        self.cells.setdefault(cell, []).append(ball)
+        self.ball_cells[ball] = cell
+
+    # function returns the balls in the cell of the given coordinates and the eight cells around it
+    def nearby(self, x, y):
+        column, row = int(x // CELL_SIZE), int(y // CELL_SIZE)
+        found = []
+        for c in (column - 1, column, column + 1):
+            for r in (row - 1, row, row + 1):
+                found.extend(self.cells.get((c, r), ()))
+        return found
+
+    # resets the collision monitor, allows for balls to collide once again
+    def reset_monitor(self):
+        if self.monitor:
+            self.monitor.clear()
+
+    # prevents the collision between two balls from being calculated again until the monitor is reset
+    def block(self, ball1, ball2):
+        i, j = self.index[ball1], self.index[ball2]
+        self.monitor.add((i, j) if i < j else (j, i))
+
+    # function returns whether the collision between two balls is currently being prevented
+    def blocked(self, ball1, ball2):
+        i, j = self.index[ball1], self.index[ball2]
+        return ((i, j) if i < j else (j, i)) in self.monitor
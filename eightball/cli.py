@@ -0,0 +1,62 @@
+"""
+    File: cli.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Command line entry point of the package. The first argument picks the command and the remaining
+                 arguments are passed on to it. Only the modules of the chosen command are imported, so the commands
+                 that do not open a window never set up the display, fonts or sounds
+                 Usage: python -m eightball [play] [--ai] [--fast-forward] [--record FILE] [--profile]
+                                            [--profile-csv FILE] [--asset-times] [--low-latency-audio]
+                        python -m eightball play --headless [--players POLICY POLICY] [--engine ENGINE] [--seed N]
+                        python -m eightball export RECORDING FOLDER [OPTIONS]
+                        python -m eightball serve|tournament|benchmark|breaks [OPTIONS]
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import sys
+import json
+import importlib
+from .common import option, option_values
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# modules whose main function runs each command
+COMMANDS = {'play': 'game', 'serve': 'server', 'tournament': 'tournament', 'benchmark': 'benchmark',
+            'breaks': 'batch_engine', 'export': 'export'}
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# plays a game between two bot policies without a window and prints how it went
+# pygame is never imported, the game is played with the same rules and physics as the windowed game
+def play_headless():
+    from .tournament import play_game, PLAYERS, MAX_SHOTS
+    players = option_values('--players', 2, PLAYERS)
+    result = play_game(0, tuple(players), option('--engine', 'step'), int(option('--max-shots', MAX_SHOTS)),
+                       int(option('--seed', 0)))
+    print(json.dumps(result, indent=2, sort_keys=True))
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    command = 'play'
+    if argv and argv[0] in COMMANDS:
+        command = argv.pop(0)
+    elif argv and not argv[0].startswith('-'):
+        print('unknown command: %s (choose from %s)' % (argv[0], ', '.join(sorted(COMMANDS))))
+        sys.exit(2)
+    # the commands read their options from the command line arguments
+    sys.argv = ['eightball ' + command] + argv
+    if command == 'play' and '--headless' in argv:
+        play_headless()
+        return
+    importlib.import_module('.' + COMMANDS[command], __package__).main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+    File: common.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Small helpers and constants shared by several modules of the package: reading options from the
+                 command line, percentiles of timings and the codes the ball colours are stored with. Imports nothing
+                 outside the standard library so that any module can use it
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import sys
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# colours of the balls in the order of their codes when stored in recordings and serialized tables
+COLOURS = ('', 'solids', 'stripes', 'eight')
+COLOUR_CODES = dict((colour, code) for code, colour in enumerate(COLOURS))
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the value following an option in the command line arguments (default if it is not given)
+def option(name, default=None):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+# function returns the given number of values following an option in the command line arguments as a tuple (default if
+# the option is not given), exits with a usage error if fewer values follow it
+def option_values(name, count, default=None):
+    if name not in sys.argv:
+        return default
+    index = sys.argv.index(name)
+    values = sys.argv[index + 1:index + 1 + count]
+    if len(values) < count or any(value.startswith('--') for value in values):
+        sys.exit('%s needs %d values' % (name, count))
+    return tuple(values)
+
+
+# function returns the percentile of a sorted list of numbers
+def percentile(values, fraction):
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
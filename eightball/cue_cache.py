@@ -0,0 +1,86 @@
+"""
+    File: cue_cache.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Caches rotated versions of the pool cue image. Angles are rounded to a set resolution, each rotation
+                 is cropped to the visible part of the cue, and the least recently used rotations are dropped once
+                 the cache reaches its memory limit
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+from collections import OrderedDict
+import pygame
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the number of bytes taken by the pixels of a surface
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# function returns a rotated surface given the original image and the angle (in degrees) to be rotated
+def rot_center(image, angle):
+    orig_rect = image.get_rect()
+    rot_image = pygame.transform.rotate(image, angle)
+    rot_rect = orig_rect.copy()
+    rot_rect.center = rot_image.get_rect().center
+    rot_image = rot_image.subsurface(rot_rect).copy()
+    return rot_image
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# cache of rotated images keyed by the angle rounded to the resolution (in degrees)
+class RotationCache (object):
+    def __init__(self, image, resolution=0.25, max_bytes=64 * 1024 * 1024):
+        self.image = image
+        self.resolution = resolution
+        self.steps = int(round(360 / resolution))
+        self.max_bytes = max_bytes
+        # rotations as (surface, offset) tuples in least to most recently used order
+        self.rotations = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # function returns the cache key of an angle
+    def key(self, angle):
+        return int(round((angle % 360) / self.resolution)) % self.steps
+
+    # function rotates the image to the angle of a key and crops it to its visible pixels
+    # returns the cropped surface and its offset from the top left corner of the uncropped rotation
+    def rotate(self, key):
+        rotated = rot_center(self.image, key * self.resolution)
+        rect = rotated.get_bounding_rect()
+        return rotated.subsurface(rect).copy(), rect.topleft
+
+    # stores a rotation, dropping the least recently used rotations if the cache is over its memory limit
+    # a rotation stored again under the same key replaces the old one, whose size is no longer counted
+    def store(self, key, rotation):
+        if key in self.rotations:
+            self.bytes -= surface_bytes(self.rotations.pop(key)[0])
+        self.rotations[key] = rotation
+        self.bytes += surface_bytes(rotation[0])
+        while self.bytes > self.max_bytes and len(self.rotations) > 1:
+            self.bytes -= surface_bytes(self.rotations.popitem(last=False)[1][0])
+
+    # function returns the rotation of the image closest to the given angle as (surface, offset)
+    # the surface is drawn at the position of the uncropped image moved by the offset
+    def get(self, angle):
+        key = self.key(angle)
+        rotation = self.rotations.get(key)
+        if rotation is not None:
+            self.hits += 1
+            self.rotations.move_to_end(key)
+            return rotation
+        self.misses += 1
+        rotation = self.rotate(key)
+        self.store(key, rotation)
+        return rotation
@@ -0,0 +1,248 @@
+"""
+    File: event_engine.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: An event driven version of the physics engine. Instead of moving the balls one pixel at a time it
+                 calculates the exact times of the next ball, wall, pocket and friction events and jumps straight
+                 from one event to the next, so the cost of a shot depends on the number of collisions rather than
+                 the distance the balls travel
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import math
+from .physics import holes, ShotResult, ball_collision_physics
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# limits of the coordinates of a ball's centre (the table walls moved inwards by the radius of a ball)
+TOP, BOTTOM, LEFT, RIGHT = 160, 640, 210, 1190
+# upper limit on the number of events processed for a single shot
+MAX_SHOT_EVENTS = 100000
+# small amount of time used to absorb rounding errors when comparing event times
+EPSILON = 1e-9
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the number of frames a ball keeps the given speed before friction slows it down
+# closed form of the logarithm used by the friction rule in physics.advance_frame
+def friction_duration(speed):
+    return max(1, math.ceil((-30) * math.log10(0.05 * (speed + 1))))
+
+
+# function returns the earliest time t >= 0 at which a point moving with velocity (vx, vy) from (dx, dy)
+# (relative to a fixed centre) reaches the given distance from the centre while moving inwards
+def time_to_distance(dx, dy, vx, vy, distance):
+    # the point must be moving towards the centre
+    approach = dx * vx + dy * vy
+    if approach >= 0:
+        return None
+    c = dx * dx + dy * dy - distance * distance
+    # already within the distance
+    if c <= 0:
+        return 0
+    a = vx * vx + vy * vy
+    discriminant = approach * approach - a * c
+    if discriminant < 0:
+        return None
+    return (-approach - math.sqrt(discriminant)) / a
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# state of every ball on the table, with positions stored relative to the time they were last updated
+class EventTable (object):
+    def __init__(self, table_state):
+        n = len(table_state)
+        self.colours = [b.colour for b in table_state]
+        # coordinates of each ball at the time it was last updated
+        self.x = [float(b.x) for b in table_state]
+        self.y = [float(b.y) for b in table_state]
+        self.updated = [0.0] * n
+        # directions in degrees, speeds and velocities in pixels per frame
+        self.direction = [b.movement_direction for b in table_state]
+        self.speed = [b.speed for b in table_state]
+        self.vx = [0.0] * n
+        self.vy = [0.0] * n
+        # frames spent at the current speed when the ball was last updated
+        self.elapsed = [max(b.frames - 1, 0) for b in table_state]
+        self.potted = [b.potted for b in table_state]
+        # current time in frames
+        self.time = 0.0
+        # next wall, pocket or friction event of each ball as (time, kind)
+        self.ball_events = [None] * n
+        # times of the next collision between each pair of balls, keyed by (i, j) with i < j
+        self.pair_events = {}
+
+    # function returns whether a ball is moving (a ball slower than 1 is still slowing down even though it is still)
+    def moving(self, i):
+        return not self.potted[i] and self.speed[i] > 0
+
+    # function checks for whether any balls are still moving
+    def stopped(self):
+        for i in range(len(self.x)):
+            if self.moving(i):
+                return False
+        return True
+
+    # function brings the position and frame count of a ball up to the current time
+    def sync(self, i):
+        dt = self.time - self.updated[i]
+        if dt > 0:
+            self.x[i] += self.vx[i] * dt
+            self.y[i] += self.vy[i] * dt
+            if self.moving(i):
+                self.elapsed[i] += dt
+        self.updated[i] = self.time
+
+    # function recalculates the velocity of a ball from its direction and speed
+    # a ball moves a whole number of pixels each frame, matching the stepping engine
+    def update_velocity(self, i):
+        pixels = math.floor(self.speed[i]) if self.moving(i) and self.direction[i] is not None else 0
+        if pixels > 0:
+            self.vx[i] = pixels * math.cos(math.radians(self.direction[i]))
+            self.vy[i] = -pixels * math.sin(math.radians(self.direction[i]))
+        else:
+            self.vx[i], self.vy[i] = 0.0, 0.0
+
+    # function calculates the next wall, pocket or friction event of a ball
+    def schedule_ball(self, i):
+        if not self.moving(i):
+            self.ball_events[i] = None
+            return
+        x, y, vx, vy = self.x[i], self.y[i], self.vx[i], self.vy[i]
+        # friction slows the ball down once it has spent long enough at its speed
+        event = (self.time + max(friction_duration(self.speed[i]) - self.elapsed[i], 0), 'friction')
+        # time until the ball reaches each of the walls it is moving towards
+        for velocity, position, limit, kind in ((vx, x, RIGHT, 'side'), (-vx, -x, -LEFT, 'side'),
+                                                (vy, y, BOTTOM, 'end'), (-vy, -y, -TOP, 'end')):
+            if velocity > 0:
+                t = self.time + max((limit - position) / velocity, 0)
+                if t < event[0]:
+                    event = (t, kind)
+        # time until the ball drops into each of the pockets
+        for hole in holes:
+            t = time_to_distance(x - hole[0], y - hole[1], vx, vy, 17)
+            if t is not None and self.time + t <= event[0]:
+                event = (self.time + t, 'pot')
+        self.ball_events[i] = event
+
+    # function calculates the time of the next collision between two balls
+    def schedule_pair(self, i, j):
+        key = (i, j) if i < j else (j, i)
+        self.pair_events.pop(key, None)
+        if self.potted[i] or self.potted[j]:
+            return
+        # positions of both balls at the current time
+        xi, yi = self.x[i] + self.vx[i] * (self.time - self.updated[i]), self.y[i] + self.vy[i] * (self.time - self.updated[i])
+        xj, yj = self.x[j] + self.vx[j] * (self.time - self.updated[j]), self.y[j] + self.vy[j] * (self.time - self.updated[j])
+        t = time_to_distance(xj - xi, yj - yi, self.vx[j] - self.vx[i], self.vy[j] - self.vy[i], 20)
+        if t is not None:
+            self.pair_events[key] = self.time + t
+
+    # function recalculates every event involving the given balls after their motion changed
+    def reschedule(self, changed):
+        for i in changed:
+            self.schedule_ball(i)
+            for j in range(len(self.x)):
+                if j != i:
+                    self.schedule_pair(i, j)
+
+    # function returns the next event as (time, kind, ball, other ball)
+    def next_event(self):
+        event = None
+        for i in range(len(self.ball_events)):
+            if self.ball_events[i] is not None and (event is None or self.ball_events[i][0] < event[0]):
+                event = (self.ball_events[i][0], self.ball_events[i][1], i, None)
+        for pair in self.pair_events:
+            if event is None or self.pair_events[pair] < event[0] - EPSILON:
+                event = (self.pair_events[pair], 'ball', pair[0], pair[1])
+        return event
+
+    # function moves the table to the next event and handles it
+    # returns the event in the same format as physics.advance_frame, or None for friction events
+    def advance_event(self):
+        t, kind, i, j = self.next_event()
+        self.time = max(t, self.time)
+        self.sync(i)
+        if kind == 'friction':
+            self.speed[i] -= 1
+            self.elapsed[i] = 0
+            self.update_velocity(i)
+            self.reschedule((i,))
+            return None
+        if kind == 'pot':
+            self.potted[i] = True
+            self.update_velocity(i)
+            self.reschedule((i,))
+            return 'pot', i
+        if kind in ('side', 'end'):
+            # ball loses speed
+            if self.speed[i] > 1:
+                self.speed[i] -= 1
+            # the ball is reflected off the wall and kept on the table
+            if kind == 'end':
+                self.direction[i] = (360 - self.direction[i]) % 360
+                self.y[i] = min(max(self.y[i], TOP), BOTTOM)
+            else:
+                self.direction[i] = (180 - self.direction[i]) % 360
+                self.x[i] = min(max(self.x[i], LEFT), RIGHT)
+            self.update_velocity(i)
+            self.reschedule((i,))
+            return 'wall', i
+        self.sync(j)
+        # the ball moving faster along the line between the two centres is the one that strikes the other
+        dx, dy = self.x[j] - self.x[i], self.y[j] - self.y[i]
+        if -(self.vx[j] * dx + self.vy[j] * dy) > self.vx[i] * dx + self.vy[i] * dy:
+            i, j = j, i
+        self.direction[i], self.direction[j], self.speed[i], self.speed[j] = ball_collision_physics(
+            self.x[i], self.y[i], self.x[j], self.y[j], self.direction[i], self.speed[i])
+        self.direction[i] %= 360
+        self.direction[j] %= 360
+        self.update_velocity(i)
+        self.update_velocity(j)
+        self.reschedule((i, j))
+        return 'ball', i, j
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function simulates a shot to rest by jumping from event to event and returns the outcome
+# takes the same parameters as physics.simulate_shot
+def simulate_shot(table_state, direction, power):
+    table = EventTable(table_state)
+    # strikes the cue ball
+    table.speed[0] = power
+    table.direction[0] = direction % 360
+    for i in range(len(table.x)):
+        table.update_velocity(i)
+    table.reschedule(range(len(table.x)))
+    potted, first_ball_hit = [], None
+    wall_hits, ball_hits, events = 0, 0, 0
+    while not table.stopped() and events < MAX_SHOT_EVENTS:
+        event = table.advance_event()
+        events += 1
+        if event is None:
+            continue
+        if event[0] == 'wall':
+            wall_hits += 1
+        elif event[0] == 'pot':
+            potted.append(event[1])
+        else:
+            ball_hits += 1
+            if first_ball_hit is None:
+                first_ball_hit = event[2]
+    # brings every ball up to the time the shot came to rest
+    for i in range(len(table.x)):
+        table.sync(i)
+    positions = list(zip(table.x, table.y))
+    return ShotResult(positions, potted, first_ball_hit, int(math.ceil(table.time)), wall_hits, ball_hits)
@@ -0,0 +1,223 @@
+"""
+    File: export.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Renders a recorded game to image files off-screen, for making video clips of games. The frames are
+                 drawn with the same table, ball sprites, pool cue and player information as the game window, and
+                 ranges of frames are rendered in parallel by worker processes, each saving its frames straight to
+                 the output folder. Every shot is shown with the pool cue pulled back for a moment before the strike
+                 PNG frames are written with fast zlib compression, since encoding takes far longer than drawing
+                 Usage: python -m eightball export RECORDING FOLDER [--processes N] [--format png|jpg|bmp|tga]
+                                                   [--cue-frames N] [--chunk N]
+                 The frames are at 60fps and can be joined into a video with
+                        ffmpeg -framerate 60 -i FOLDER/frame%06d.png clip.mp4
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import os
+import sys
+import time
+import zlib
+import struct
+from multiprocessing import Pool
+import pygame
+from .common import option
+from .physics import holes, angle_to_coordinates
+from .renderer import Renderer, WALLS, RED, background_items
+from .cue_cache import RotationCache
+from .assets import AssetManager
+from .recording import Recording
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# size of the game window
+SIZE = (1400, 800)
+# frames per second of the exported frames, the rate the physics is stepped at
+FPS = 60
+# frames the pool cue is shown pulled back before each shot, and the frames the table is shown after the last shot
+CUE_FRAMES = 30
+# frames rendered by each task given to a worker
+CHUNK_SIZE = 60
+# name of each frame file, numbered from 0
+FRAME_NAME = 'frame%06d.'
+# zlib compression level of the PNG frames, level 1 is about five times faster to encode than the default of pygame
+PNG_LEVEL = 1
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# ==================================================================================================================
+# WORKER STATE
+# ==================================================================================================================
+# set once in each worker process by init_worker
+recording = None
+renderer = None
+sprites = None
+pool_cue_rotations = None
+frames = None
+scenes = None
+pattern = None
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns a PNG chunk of the given type and data
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+# saves a surface as an 8 bit RGB PNG file, compressed with the given zlib level
+def save_png(surface, path, level=PNG_LEVEL):
+    width, height = surface.get_size()
+    pixels = pygame.image.tobytes(surface, 'RGB')
+    stride = width * 3
+    # each row starts with its filter type, 0 for no filtering
+    rows = b''.join(b'\x00' + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    with open(path, 'wb') as file:
+        file.write(PNG_SIGNATURE)
+        file.write(png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        file.write(png_chunk(b'IDAT', zlib.compress(rows, level)))
+        file.write(png_chunk(b'IEND', b''))
+
+
+# function returns the frames to export and the backgrounds they are drawn on
+# each frame is a (scene, recorded frame, shot) tuple: the index of its background in the list of scenes, the
+# recorded frame the balls are drawn from (-1 for the starting rack) and the shot whose pool cue is drawn (-1 if none)
+# each scene is a (player turn, colours, potted balls, winner) tuple
+def plan_frames(recording, cue_frames=CUE_FRAMES):
+    states = recording.turns()
+    planned, scene_list, scene_index = [], [], {}
+    # numbers of the potted balls in the order they were potted
+    potted = []
+
+    # function returns the index of the scene of a game state and the potted balls, adding it if it is new
+    def scene(state):
+        key = (state.player_turn, (state.colour(1), state.colour(2)), tuple(potted), state.winner)
+        if key not in scene_index:
+            scene_index[key] = len(scene_list)
+            scene_list.append(key)
+        return scene_index[key]
+
+    previous = -1
+    for number, shot in enumerate(recording.shots):
+        # the cue ball is taken back out of the pocket once the turn is over
+        if 0 in potted:
+            potted.remove(0)
+        planned += [(scene(states[number]), previous, number)] * cue_frames
+        for frame in range(shot.first_frame, shot.first_frame + shot.frame_count):
+            for ball, (x, y, speed, is_potted) in enumerate(recording.frame(frame)):
+                if is_potted and ball not in potted:
+                    potted.append(ball)
+            planned.append((scene(states[number]), frame, -1))
+        previous = shot.first_frame + shot.frame_count - 1
+    planned += [(scene(states[-1]), previous, -1)] * cue_frames
+    return planned, scene_list
+
+
+# function returns the balls of a frame to export as a list of (x, y, potted) tuples
+# before a shot the cue ball is drawn where it was placed if it was in hand
+def ball_positions(frame, shot):
+    if frame < 0:
+        positions = [(x, y, False) for x, y in recording.start]
+    else:
+        positions = [(x, y, is_potted) for x, y, speed, is_potted in recording.frame(frame)]
+    if shot >= 0 and recording.shots[shot].placement is not None:
+        positions[0] = recording.shots[shot].placement + (False,)
+    return positions
+
+
+# loads the recording, images and font once in each worker process
+# nothing is drawn on the screen, so only the font library is initialized
+def init_worker(path, planned, scene_list, frame_pattern):
+    global recording, renderer, sprites, pool_cue_rotations, frames, scenes, pattern
+    pygame.font.init()
+    recording = Recording(path)
+    assets = AssetManager()
+    renderer = Renderer(pygame.Surface(SIZE), pygame.font.SysFont("impact", 30), WALLS, holes)
+    sprites = [assets.ball_sprite(n) for n in range(recording.number_of_balls)]
+    pool_cue_rotations = RotationCache(assets.image('images/cue.png'))
+    frames, scenes, pattern = planned, scene_list, frame_pattern
+
+
+# draws a frame to export onto the surface of the renderer
+def draw_frame(index):
+    scene, frame, shot = frames[index]
+    player_turn, colours, potted, winner = scenes[scene]
+    renderer.set_background(*background_items(player_turn, colours, [sprites[ball] for ball in potted]))
+    positions = ball_positions(frame, shot)
+    for ball in range(len(positions)):
+        x, y, is_potted = positions[ball]
+        if not is_potted:
+            renderer.blit(sprites[ball], (x - 10, y - 10))
+    # the pool cue is pulled back from the cue ball as far as it was for the shot
+    if shot >= 0:
+        cue_direction = recording.shots[shot].cue_direction
+        temporary_angle = cue_direction + 180
+        if temporary_angle > 360:
+            temporary_angle -= 360
+        pool_cue_rotated, pool_cue_offset = pool_cue_rotations.get(cue_direction)
+        pool_cue_coords = angle_to_coordinates(positions[0][0] - 457, positions[0][1] - 454, temporary_angle,
+                                               recording.shots[shot].strike_distance)
+        renderer.blit(pool_cue_rotated, (pool_cue_coords[0] + pool_cue_offset[0], pool_cue_coords[1] + pool_cue_offset[1]))
+    if winner is not None:
+        renderer.blit(renderer.text('PLAYER ' + str(winner) + ' WINS!', RED), (615, 390))
+    renderer.render()
+
+
+# function renders the frames from start up to end and saves each one, returns the number of frames saved
+def render_range(bounds):
+    start, end = bounds
+    for index in range(start, end):
+        draw_frame(index)
+        if pattern.endswith('.png'):
+            save_png(renderer.display, pattern % index)
+        else:
+            pygame.image.save(renderer.display, pattern % index)
+    return end - start
+
+
+# function renders every frame of a recording into a folder and returns the number of frames saved
+# progress is called with the number of frames saved so far as the workers finish their ranges
+def export(path, folder, processes=None, image_format='png', cue_frames=CUE_FRAMES, chunk_size=CHUNK_SIZE,
+           progress=None):
+    source = Recording(path)
+    planned, scene_list = plan_frames(source, cue_frames)
+    source.close()
+    os.makedirs(folder, exist_ok=True)
+    frame_pattern = os.path.join(folder, FRAME_NAME + image_format)
+    ranges = [(start, min(start + chunk_size, len(planned))) for start in range(0, len(planned), chunk_size)]
+    saved = 0
+    with Pool(processes, init_worker, (path, planned, scene_list, frame_pattern)) as pool:
+        for count in pool.imap_unordered(render_range, ranges):
+            saved += count
+            if progress is not None:
+                progress(saved)
+    return saved
+
+# ==================================================================================================================
+# MAIN CODE
+# ==================================================================================================================
+
+
+def main():
+    arguments = [argument for index, argument in enumerate(sys.argv[1:])
+                 if not argument.startswith('--') and not sys.argv[index].startswith('--')]
+    if len(arguments) < 2:
+        print(__doc__)
+        sys.exit(2)
+    path, folder = arguments[:2]
+    processes = int(option('--processes', os.cpu_count()))
+    start = time.perf_counter()
+    count = export(path, folder, processes, option('--format', 'png'), int(option('--cue-frames', CUE_FRAMES)),
+                   int(option('--chunk', CHUNK_SIZE)),
+                   lambda saved: print('\r%d frames' % saved, end='', flush=True))
+    seconds = time.perf_counter() - start
+    print('\r%d frames in %.2f s with %d processes: %.1f fps, %.1fx real time' %
+          (count, seconds, processes, count / seconds, count / seconds / FPS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,532 @@
+"""
+    File: game.py
+    Author: Bob Wei
+    Date: 6/6/2017
+    Project Name: 8 Ball Pool
+    Description: An 8 Ball Pool game that uses a self-written Pygame game engine to provide accurate game physics and 
+                 monitoring of game events and player input. Importing the module does not start anything, the display,
+                 fonts and sounds are only set up when a game is started with main()
+    Variable Table: All global game variable are explained in the "IN-GAME LIST AND VARIABLE DECLARATIONS" section
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import sys
+import pygame
+from pygame.locals import *
+import atexit
+from .common import option
+from .physics import holes, RACK, distance_between_points, coordinates_to_angle, angle_to_coordinates, \
+    touching_other_ball, balls_stopped, strike_speed, advance_frame
+from .broadphase import CollisionTracker
+from .ai import MonteCarloPlayer, place_cue_ball
+from .renderer import Renderer, WALLS, background_items
+from .cue_cache import RotationCache
+from .assets import AssetManager
+from .audio import AudioScheduler
+from .recording import ShotRecorder
+from .profiler import FrameProfiler
+from .rules import GameState, resolve_turn
+from .aim_guide import AimGuide
+from .scheduler import FrameScheduler
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# seconds of game time simulated by each physics step (ball speeds are in pixels per step)
+PHYSICS_STEP = 1 / 60
+# upper limit on the physics steps run in one frame, the game slows down instead of falling further behind
+MAX_STEPS_PER_FRAME = 8
+# seconds the table stays still after a shot before the turn is resolved
+TURN_DELAY = 0.25
+# colours
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# class for the balls used in the game
+class Ball (object):
+    def __init__(self, colour, x, y, sprite):
+        # stripes or solids
+        self.colour = colour
+        # coordinates of ball
+        self.x = x
+        self.y = y
+        # sprite of ball
+        self.sprite = sprite
+        # direction of ball in degrees
+        self.movement_direction = 0
+        # speed of ball
+        self.speed = 0
+        # frames used in ball movement
+        self.frames = 0
+        # check for whether ball is potted
+        self.potted = False
+
+# ==================================================================================================================
+# IN-GAME LIST AND VARIABLE DECLARATIONS
+# ==================================================================================================================
+# the font, display, assets, sounds, clock and scheduler are set by init_media, and the renderer, pool cue images,
+# balls and collision tracker by set_up_table, when the game is started
+mainFont = gameDisplay = assets = None
+audio = None
+clock = scheduler = None
+renderer = None
+pool_cue_rotations = None
+balls = cue_ball = tracker = None
+ball_colours = None
+# variables that will be used to store rotated version of pool cue image
+# and its offset from the coordinates of the pool cue image
+pool_cue_rotated, pool_cue_offset = None, (0, 0)
+# stores the coordinates of the pool cue image
+pool_cue_coords = (0, 0)
+# stores the coordinates of the mouse cursor when needed
+mouse_hold_coords = (0, 0)
+# keeps track of the state of the mouse
+mouse_held = False
+# variable that stores the direction of the player cue as a number in degrees
+cue_direction = 0
+# variable used to store the distance the player pulls the cue back to strike the ball
+strike_distance = 0
+draw_guide = True
+# predicts and caches the path of the cue ball shown while aiming
+aim_guide = AimGuide()
+# boolean variable keeping tack of whether or not any balls are in motion
+in_play = False
+# seconds of game time that have passed but not been simulated yet
+physics_time = 0
+# seconds taken by the last frame
+frame_time = 0
+# positions of the balls before the last physics step, used to draw the balls between steps (None between shots)
+previous_positions = None
+# seconds the table has been still since the balls stopped
+settle_time = 0
+# boolean variable representing whether the current shot is played out at once, showing only where the balls stop
+# every shot is when the game is started with --fast-forward, otherwise F skips the shot being played
+fast_forward = False
+skip_shot = False
+# state of the game between shots: the player in possession, the colours of the players, whether the cue ball
+# is in hand and the winning player
+game = GameState()
+# variable that will store the index of the first ball hit by the cue ball during each player's turn
+first_ball_hit = None
+# computer player that controls player 2 when the game is started with --ai (None if player 2 is human)
+computer_player = None
+# boolean variable keeping track of whether the computer is searching for its shot
+computer_thinking = False
+# records every shot to the given file when the game is started with --record <file> (None if not recording)
+recorder = None
+# times each phase of the frame when the game is started with --profile (None if not profiling)
+# F3 toggles the overlay and --profile-csv <file> writes every frame to a CSV file
+profiler = None
+# list for storing the indices of the balls that have been potted after each turn
+recent_potted_balls = []
+# list for storing all of the potted balls over the course of the game
+potted_balls = []
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# initializes the display and font libraries and opens the game window
+# the mixer is only started when the first sound is played, with a small buffer if low_latency_audio is True
+def init_media(low_latency_audio=False):
+    global mainFont, gameDisplay, assets, audio, clock, scheduler
+    pygame.display.init()
+    pygame.font.init()
+    # used fonts
+    mainFont = pygame.font.SysFont("impact", 30)
+    # sets the display size
+    gameDisplay = pygame.display.set_mode((1400, 800))
+    pygame.display.set_caption('8 Ball Pool')
+    # loads the images and sounds, converted to the display format once the display is open
+    assets = AssetManager()
+    # plays the sound effects of each frame once it is drawn, each sound is loaded the first time it is played
+    audio = AudioScheduler(assets, low_latency=low_latency_audio)
+    # built in frame rate throttling
+    clock = pygame.time.Clock()
+    # draws frames at up to 60fps while something is moving and sleeps until the next input while nothing changes
+    scheduler = FrameScheduler(clock, 60)
+
+
+# sets up the renderer, the pool cue and the balls in the initial rack
+def set_up_table():
+    global renderer, pool_cue_rotations, pool_cue_rotated, pool_cue_offset, balls, cue_ball, tracker, ball_colours
+    # draws the frames, redrawing only the parts of the display that change
+    renderer = Renderer(gameDisplay, mainFont, WALLS, holes)
+    # cache of the rotated versions of the pool cue image
+    pool_cue_rotations = RotationCache(assets.image('images/cue.png'))
+    pool_cue_rotated, pool_cue_offset = pool_cue_rotations.get(0)
+    # list containing ball objects (all 16 balls) in the initial rack
+    balls = [Ball(RACK[n][0], RACK[n][1], RACK[n][2], assets.ball_sprite(n)) for n in range(len(RACK))]
+    # the cue ball is the first ball of the rack
+    cue_ball = balls[0]
+    # keeps track of the grid cells of the balls and which balls have just collided
+    tracker = CollisionTracker(balls)
+    # colours of the balls, used by the game rules
+    ball_colours = [b.colour for b in balls]
+
+
+# sets the background of the frame: the pool table, the player and turn information at the top of the game display
+# and the potted balls on the lower left portion of the screen
+def draw_background():
+    renderer.set_background(*background_items(game.player_turn, (game.colour(1), game.colour(2)),
+                                               [ball.sprite for ball in potted_balls]))
+
+
+# draws each of the balls present
+# while the balls are moving they are drawn between their positions before and after the last physics step
+def draw_balls():
+    if previous_positions is None:
+        for ball in balls:
+            if not ball.potted:
+                renderer.blit(ball.sprite, (ball.x - 10, ball.y - 10))
+        return
+    # fraction of the next physics step that has already passed, the time left over after the last step
+    alpha = min(physics_time / PHYSICS_STEP, 1)
+    for ball, (x, y) in zip(balls, previous_positions):
+        if not ball.potted:
+            renderer.blit(ball.sprite, (x + (ball.x - x) * alpha - 10, y + (ball.y - y) * alpha - 10))
+
+
+# function returns the events with each run of consecutive mouse motion events merged into the last one
+# only the newest position of the mouse matters, so fast mouse movement costs a single aim update per frame
+def coalesce_motion(events):
+    merged = []
+    for event in events:
+        if event.type == MOUSEMOTION and merged and merged[-1].type == MOUSEMOTION:
+            merged[-1] = event
+        else:
+            merged.append(event)
+    return merged
+
+
+# function returns whether it is the computer player's turn
+def computer_turn():
+    return computer_player is not None and game.player_turn == 2
+
+
+# function call for when the ball is in hand (able to be moved by the player)
+def ball_in_hand():
+    # variables for ball and mouse state
+    ball_dropped = False
+    button_down = False
+    # the first frame shows the result of the turn
+    scheduler.request_redraw()
+    while not ball_dropped:
+        # waits for the player to move the mouse
+        scheduler.wait(False)
+        # acquires each game event before drawing, so the cue ball is drawn where the mouse is now
+        for e in coalesce_motion(scheduler.events()):
+            # quits game if user exits
+            if e.type == QUIT:
+                pygame.quit()
+                sys.exit()
+            # if the mouse is moved, the coordinates are obtained and the cue ball is moved only if the mouse is
+            # not colliding with any of the other active balls
+            if e.type == MOUSEMOTION:
+                mouseX, mouseY = pygame.mouse.get_pos()
+                if 210 < mouseX < 1190 and 160 < mouseY < 640:
+                    if not touching_other_ball(mouseX, mouseY, cue_ball, balls):
+                        cue_ball.x, cue_ball.y = mouseX, mouseY
+                        tracker.update(cue_ball)
+            # once the player clicks, the ball is dropped and the ball is no longer in hand
+            if e.type == MOUSEBUTTONDOWN:
+                button_down = True
+            if e.type == MOUSEBUTTONUP and button_down:
+                ball_dropped = True
+        # draws everything
+        draw_background()
+        draw_balls()
+        renderer.update()
+        scheduler.tick()
+
+
+# function call for when the game ends and a winner is determined
+def game_over():
+    # the first frame shows the winner
+    scheduler.request_redraw()
+    while True:
+        # nothing moves once the game is over, so a frame is only drawn after an input event
+        scheduler.wait(False)
+        # acquires each game event
+        for e in scheduler.events():
+            # quits game if user exits
+            if e.type == QUIT:
+                pygame.quit()
+                sys.exit()
+        # draws everything
+        draw_background()
+        draw_balls()
+        # draws text saying who won the match
+        renderer.blit(renderer.text('PLAYER ' + str(game.winner) + ' WINS!', RED), (615, 390))
+        # updates screen
+        renderer.update()
+        scheduler.tick()
+
+
+# plays the game until one of the players wins
+def play():
+    global previous_positions, physics_time, settle_time, frame_time, skip_shot, first_ball_hit, game, in_play, \
+        pool_cue_coords, pool_cue_rotated, pool_cue_offset, computer_thinking, draw_guide, cue_direction, \
+        strike_distance, mouse_hold_coords, mouse_held
+    while game.winner is None:
+        # sleeps until the next input event while the table is still, the player is not pulling back the cue
+        # and the computer is not taking its turn
+        scheduler.wait(in_play or mouse_held or computer_turn())
+        if profiler is not None:
+            profiler.mark('idle')
+
+        # =====================================================================================================================
+        # INPUT STAGE
+        # =====================================================================================================================
+        # the input is handled before anything is drawn, so the pool cue and the guide show the newest input
+        # the mouse position is read once and each run of queued motion events is merged into one aim update
+        mouseX, mouseY = pygame.mouse.get_pos()
+        # ============
+        # DRAWING CUE
+        # ============
+        # executes when the mouse button is held down and no balls are in play
+        if mouse_held and not in_play:
+            # adjusts angle value if it is greater than 360
+            temporary_angle = cue_direction + 180
+            if temporary_angle > 360:
+                temporary_angle -= 360
+            # the distance the player pulls away from the initial mouse position is calculated
+            # 210 is capped as the upper limit for the strike distance
+            strike_distance = distance_between_points(mouse_hold_coords[0], mouse_hold_coords[1], mouseX, mouseY)
+            if strike_distance > 210:
+                strike_distance = 210
+            # the image of the pool cue is updated based on how much the player pulls back
+            # image follows the mouse as it moves
+            pool_cue_coords = angle_to_coordinates(cue_ball.x - 457, cue_ball.y - 454, temporary_angle, strike_distance)
+        # ==================
+        # GAME EVENT HANDLER
+        # ==================
+        # acquires each game event
+        for event in coalesce_motion(scheduler.events()):
+            # quits game if user exits
+            if event.type == QUIT:
+                pygame.quit()
+                sys.exit()
+            # plays out the rest of the shot at once
+            if in_play and event.type == KEYDOWN and event.key == K_f:
+                skip_shot = True
+            # shows or hides the profiler overlay
+            if profiler is not None and event.type == KEYDOWN and event.key == K_F3:
+                profiler.toggle_overlay()
+            # does not execute if a ball is still in play (is moving) or the computer is taking its turn
+            if not in_play and not computer_turn():
+                # when player holds down on mouse, the coordinates of the mouse are tracked
+                if event.type == MOUSEBUTTONDOWN:
+                    mouse_hold_coords = (mouseX, mouseY)
+                    mouse_held = True
+                # executes once mouse button is released up
+                elif event.type == MOUSEBUTTONUP:
+                    mouse_held = False
+                    # if the player has pulled back on the cue a sufficient amount, a shot will be registered
+                    if strike_distance > 10:
+                        # cue ball is given speed value proportional to the distance the player pulls back
+                        cue_ball.speed = strike_speed(strike_distance)
+                        in_play = True
+                        skip_shot = fast_forward
+                        draw_guide = False
+                        # plays the strike sound
+                        audio.queue('strike', cue_ball.speed)
+                        if recorder is not None:
+                            recorder.start_shot(cue_direction, strike_distance)
+                    # cue ball direction is updated as the direction the cue was aimed in
+                    cue_ball.movement_direction = cue_direction
+                    # resets the monitor so that all ball collisions can occur again
+                    tracker.reset_monitor()
+                # detects for mouse motion
+                elif event.type == MOUSEMOTION and mouse_held is False:
+                    draw_guide = True
+                    mouse_hold_coords = mouseX, mouseY
+                    # uses the function to calculate the angle of the line connecting cursor position and cue ball position
+                    cue_direction = coordinates_to_angle(cue_ball.x, cue_ball.y, mouseX, mouseY)
+                    # looks up the rotated image of the pool cue in the cache
+                    pool_cue_rotated, pool_cue_offset = pool_cue_rotations.get(cue_direction)
+                    pool_cue_coords = (cue_ball.x - 457, cue_ball.y - 454)
+        if profiler is not None:
+            profiler.mark('events')
+
+        # if balls are in play
+        if in_play:
+            # runs as many physics steps as the time passed allows, or the whole shot at once when it is skipped
+            steps = 0
+            while not balls_stopped(balls) and (skip_shot or (physics_time >= PHYSICS_STEP and steps < MAX_STEPS_PER_FRAME)):
+                previous_positions = [(ball.x, ball.y) for ball in balls]
+                # moves each of the moving balls by one step
+                events = advance_frame(balls, tracker)
+                # queues the sunk and hit sounds, played once the frame is drawn
+                if not skip_shot:
+                    audio.queue_events(events, balls)
+                # handles the events that occurred during the step
+                for event in events:
+                    # adjusts the lists if a ball was potted
+                    if event[0] == 'pot':
+                        recent_potted_balls.append(event[1])
+                        potted_balls.append(balls[event[1]])
+                    # updates the first ball collided variable if it is None
+                    elif event[0] == 'ball' and first_ball_hit is None:
+                        first_ball_hit = event[2]
+                if recorder is not None:
+                    recorder.record_frame(balls)
+                physics_time -= PHYSICS_STEP
+                steps += 1
+            # time the physics could not keep up with is dropped
+            physics_time = min(max(physics_time, 0), PHYSICS_STEP)
+            # updates the coordinates of the pool cue with those of the moving cue ball
+            pool_cue_coords = (cue_ball.x - 457, cue_ball.y - 454)
+            if profiler is not None:
+                profiler.mark('physics')
+            # the table stays still for a moment once the balls have stopped, while the game keeps drawing
+            if balls_stopped(balls) and settle_time < TURN_DELAY:
+                previous_positions = None
+                settle_time += frame_time
+            # if all balls have stopped moving and the table has settled...
+            if balls_stopped(balls) and settle_time >= TURN_DELAY:
+                settle_time = 0
+                skip_shot = False
+                if recorder is not None:
+                    recorder.end_shot()
+
+                # ===================================
+                # RESOLVES THE TURN WITH THE GAME RULES
+                # ===================================
+                # determines the colours, whether the player turn changes, if the ball is in hand and the winner
+                game = resolve_turn(game, recent_potted_balls, first_ball_hit, ball_colours)[0]
+                # clears the list for recently potted balls and the first ball hit
+                # prepares them for the following turn
+                recent_potted_balls[:] = []
+                first_ball_hit = None
+                # calls the game over function if the game has been won
+                if game.winner is not None:
+                    game_over()
+                # if cue ball is potted, it is taken back out of the pocket
+                if cue_ball.potted:
+                    potted_balls.remove(cue_ball)
+                    cue_ball.potted = False
+                # if cue ball is supposed to be in hand, then the ball in hand function is called
+                # and the coordinates of the cue ball are adjusted
+                if game.cue_ball_in_hand:
+                    # the computer places the cue ball itself
+                    if computer_turn():
+                        cue_ball.x, cue_ball.y = place_cue_ball(balls, cue_ball)
+                        tracker.update(cue_ball)
+                    else:
+                        ball_in_hand()
+                    if recorder is not None:
+                        recorder.place_cue_ball(cue_ball.x, cue_ball.y)
+                    pool_cue_coords = (cue_ball.x - 457, cue_ball.y - 454)
+                    game = game.replace(cue_ball_in_hand=False)
+
+                # balls are no longer in play
+                in_play = False
+                # the turn and potted balls shown change once the turn is resolved
+                scheduler.request_redraw()
+            if profiler is not None:
+                profiler.mark('turn')
+
+        # draws the background setting of the game once the physics has caught up
+        draw_background()
+        # draws each of the balls present
+        draw_balls()
+        if profiler is not None:
+            profiler.mark('draw')
+
+        # =====================================================================================================================
+        # CODE FOR PLAYER TURN (COMPUTER SHOT AND AIM GUIDE)
+        # =====================================================================================================================
+        # makes sure that no balls are in play
+        if not in_play:
+            # =============
+            # COMPUTER TURN
+            # =============
+            if computer_turn():
+                # starts the search for the computer's shot, which runs while the game keeps drawing
+                if not computer_thinking:
+                    computer_player.start_turn(balls, game)
+                    computer_thinking = True
+                    draw_guide = False
+                # takes the shot once the search has finished
+                elif computer_player.ready():
+                    computer_thinking = False
+                    cue_direction, strike_distance = computer_player.choice
+                    pool_cue_rotated, pool_cue_offset = pool_cue_rotations.get(cue_direction)
+                    cue_ball.speed = strike_speed(strike_distance)
+                    cue_ball.movement_direction = cue_direction
+                    tracker.reset_monitor()
+                    in_play = True
+                    skip_shot = fast_forward
+                    audio.queue('strike', cue_ball.speed)
+                    if recorder is not None:
+                        recorder.start_shot(cue_direction, strike_distance)
+            if draw_guide:
+                # draws the predicted path of the cue ball to help the player aim
+                # until the cue is pulled back far enough for a shot, the path of the hardest strike is shown
+                guide_power = strike_speed(strike_distance if mouse_held and strike_distance > 10 else 210)
+                aim_guide.draw(renderer, aim_guide.get(balls, cue_direction, guide_power))
+                # draws the image of the pool cue
+                renderer.blit(pool_cue_rotated, (pool_cue_coords[0] + pool_cue_offset[0], pool_cue_coords[1] + pool_cue_offset[1]))
+                # draws a circle to help the player aim
+                renderer.circle(WHITE, mouse_hold_coords, 10, 1)
+        if profiler is not None:
+            profiler.mark('aiming')
+
+        # =====================================================================================================================
+        # UPDATE GRAPHICS
+        # =====================================================================================================================
+        if profiler is not None:
+            profiler.draw_overlay(renderer)
+        # updates the parts of the display that changed and plays the sounds of the frame along with it
+        renderer.update()
+        audio.flush()
+        if profiler is not None:
+            profiler.mark('display')
+        # caps frame rate at 60fps
+        frame_time = scheduler.tick()
+        # the time passed is simulated by the physics while balls are in play
+        if in_play:
+            physics_time += frame_time
+        if profiler is not None:
+            profiler.mark('idle')
+            profiler.end_frame()
+
+# =====================================================================================================================
+# MAIN CODE
+# =====================================================================================================================
+
+
+# starts a game with the options given in the command line arguments
+def main():
+    global fast_forward, computer_player, recorder, profiler
+    init_media('--low-latency-audio' in sys.argv)
+    set_up_table()
+    fast_forward = '--fast-forward' in sys.argv
+    if '--ai' in sys.argv:
+        computer_player = MonteCarloPlayer()
+        atexit.register(computer_player.close)
+    if option('--record') is not None:
+        recorder = ShotRecorder(option('--record'), balls)
+        atexit.register(recorder.close)
+    if '--profile' in sys.argv:
+        profiler = FrameProfiler(option('--profile-csv'))
+        profiler.install(globals())
+        atexit.register(profiler.close)
+    # prints how long each asset took to load when the game is started with --asset-times
+    if '--asset-times' in sys.argv:
+        for line in assets.report():
+            print(line)
+    play()
+
+
+if __name__ == '__main__':
+    main()
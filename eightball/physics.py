@@ -0,0 +1,350 @@
+"""
+    File: physics.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: The headless physics engine of the game. Contains the ball movement, wall collision, ball collision,
+                 pocket and friction rules used by main.py, along with a function that simulates an entire shot to
+                 rest without opening a window, playing sounds or waiting on the frame clock
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import math
+import importlib
+from .broadphase import CollisionTracker
+
+# ==================================================================================================================
+# TABLE CONSTANTS
+# ==================================================================================================================
+# tuple containing coordinates of pockets
+holes = ((210, 160), (700, 150), (1190, 160), (210, 640), (700, 650), (1190, 640))
+# upper limit on the number of frames simulated for a single shot
+# guards against a shot that never comes to rest
+MAX_SHOT_FRAMES = 100000
+# names of the engine modes mapped to the modules that implement them
+# every engine module provides a simulate_shot function taking the same parameters as the one below
+# the step and batch engines play shots out exactly as the game does, the event engine approximates it
+ENGINES = {'step': 'physics', 'event': 'event_engine', 'batch': 'batch_engine'}
+# colour and starting coordinates of each ball in the initial rack, cue ball first
+RACK = (('', 550, 400), ('solids', 950, 400), ('solids', 986, 420), ('solids', 1022, 420), ('solids', 1022, 360),
+        ('solids', 968, 390), ('solids', 1004, 410), ('solids', 1004, 370), ('eight', 986, 400),
+        ('stripes', 986, 380), ('stripes', 1004, 430), ('stripes', 1004, 390), ('stripes', 1022, 440),
+        ('stripes', 1022, 380), ('stripes', 968, 410), ('stripes', 1022, 400))
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# lightweight copy of a ball used by the engine
+# holds no sprite so that shots can be simulated without pygame
+class SimBall (object):
+    __slots__ = ('colour', 'x', 'y', 'movement_direction', 'speed', 'frames', 'potted')
+
+    def __init__(self, colour, x, y):
+        # stripes or solids
+        self.colour = colour
+        # coordinates of ball
+        self.x = x
+        self.y = y
+        # direction of ball in degrees
+        self.movement_direction = 0
+        # speed of ball
+        self.speed = 0
+        # frames used in ball movement
+        self.frames = 0
+        # check for whether ball is potted
+        self.potted = False
+
+
+# class storing the outcome of a simulated shot
+class ShotResult (object):
+    def __init__(self, positions, potted, first_ball_hit, frames, wall_hits, ball_hits):
+        # final coordinates of each ball, in the same order as the table state that was simulated
+        self.positions = positions
+        # indices of the balls potted during the shot, in the order they were potted
+        self.potted = potted
+        # index of the first ball collided with during the shot (None if no ball was hit)
+        self.first_ball_hit = first_ball_hit
+        # number of frames it took for all of the balls to stop moving
+        self.frames = frames
+        # number of wall and ball collisions that occurred during the shot
+        self.wall_hits = wall_hits
+        self.ball_hits = ball_hits
+        # the cue ball is always the first ball of the table state
+        self.cue_ball_potted = 0 in potted
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function finds the distance between two points given the x and y coordinates
+def distance_between_points(x1, y1, x2, y2):
+    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+
+# function finds the difference in degrees between two angles
+def difference_between_angles(a1, a2):
+    # finds the absolute differences between the two angles (two different orders)
+    distance1, distance2 = abs(a1 - a2), abs(a2 - a1)
+
+    # if the first distance is less than or equal to 180 degrees, the second must be greater than 180
+    # and so the first angle is returned
+    if distance1 <= 180:
+        return distance1
+    # similarly the second angle is returned if it is less than or equal to 180 degrees
+    elif distance2 <= 180:
+        return distance2
+    # if else, then another angle value is returned that takes into account the cyclic nature of degrees
+    # (0-360 cycle, where 1 degrees is the same as 361 degrees)
+    else:
+        if a1 > a2:
+            return 360 - a1 + a2
+        else:
+            return 360 - a2 + a1
+
+
+# function finds the angle formed by the line connecting any two coordinates
+def coordinates_to_angle(x1, y1, x2, y2):
+    # finds the x and y differences between the two separate coordinates
+    x_diff, y_diff = x2 - x1, -(y2 - y1)
+    # checks if the x difference (denominator) is 0
+    if x_diff == 0:
+        # depending on the value of the y difference, the angle is determined
+        if y_diff > 0:
+            return 90
+        elif y_diff < 0:
+            return 270
+        else:
+            return 0
+    # if the x difference is not 0, then inverse tangent is used to find the temporary angle beta
+    else:
+        beta = math.degrees(math.atan(y_diff/x_diff))
+
+    if x_diff > 0:
+        if y_diff < 0:
+            beta += 360
+    elif x_diff < 0:
+        beta += 180
+    # returns the angle in degrees
+    return beta
+
+
+# function finds the second coordinate of a line given the angle, first coordinate, and length of the line
+def angle_to_coordinates(startx, starty, angle, length):
+    if angle is not None:
+        return startx + length * math.cos(math.radians(angle)), starty - length * math.sin(math.radians(angle))
+    else:
+        return startx, starty
+
+
+# function returns the angle of a moving ball if it collides with a wall (given the ball's coordinates)
+def collision_with_wall(x, y, angle):
+    # returns the modified angle depending on which wall the ball collides with
+    # if the ball collides with upper or lower wall
+    if y - 10 <= 150 or y + 10 >= 650:
+        return 360 - angle
+    # if the ball collides with right wall
+    elif x + 10 >= 1200:
+        if angle < 90:
+            return 180 - angle
+        elif angle > 270:
+            return 540 - angle
+    # if the ball collides with left wall
+    elif x - 10 <= 200:
+        if 180 > angle > 90:
+            return 180 - angle
+        elif 270 > angle >= 180:
+            return 540 - angle
+
+
+# checks whether a given ball is colliding with any of the other balls
+# only the balls in the grid cells around the given coordinates are compared
+def check_collision_with_other_ball(x, y, ball1, tracker):
+    collided_with = None
+    for b in tracker.nearby(x, y):
+        # checks the collision monitor to make sure that the specific collision is not redundant
+        if not b.potted and not tracker.blocked(ball1, b):
+            # makes sure that the two balls being compared are not the same ball
+            if b.x != x and b.y != y:
+                # finally checks if the two balls collide
+                if distance_between_points(x, y, b.x, b.y) <= 20:
+                    # the ball that comes first in the balls list is returned if there is more than one collision
+                    if collided_with is None or tracker.index[b] < tracker.index[collided_with]:
+                        collided_with = b
+    return collided_with
+
+
+# function returns whether a ball placed at the given coordinates would touch any of the other balls on the table
+# used when the cue ball is in hand, the ball being placed is left out so that it is never in the way of itself
+def touching_other_ball(x, y, ball, balls):
+    for b in balls:
+        if b is not ball and not b.potted and distance_between_points(x, y, b.x, b.y) <= 20:
+            return True
+    return False
+
+
+# function returns the updated directions and speeds of balls after a collision based on physics
+def ball_collision_physics(x1, y1, x2, y2, initial_angle, initial_speed):
+    # the angle of the second ball will be the angle determined by the origins of the two colliding balls
+    angle2 = coordinates_to_angle(x1, y1, x2, y2)
+    # two variables used to determine which direction initial ball came from (left or right of second ball)
+    clockwise, counter_clockwise = angle2 - 90, angle2 + 90
+    # the angle of the first ball is determined based on which value the initial angle is closer to
+    if difference_between_angles(clockwise, initial_angle) < difference_between_angles(counter_clockwise, initial_angle):
+        angle1 = clockwise
+    else:
+        angle1 = counter_clockwise
+    # speeds of each ball is determined through vector projection calculations
+    speed1 = initial_speed * math.cos(math.radians(difference_between_angles(angle1, initial_angle)))
+    speed2 = initial_speed * math.cos(math.radians(difference_between_angles(angle2, initial_angle)))
+    # makes sure the speed is not a decimal value that is less than 1
+    if speed1 < 1:
+        speed1 = 1
+    if speed2 < 1:
+        speed2 = 1
+    # returns the updated values
+    return angle1, angle2, speed1, speed2
+
+
+# function checks for whether any balls are still moving
+def balls_stopped(balls):
+    for ball in balls:
+        if ball.speed > 0 and not ball.potted:
+            return False
+    # returns true if none are moving
+    return True
+
+
+# function for checking if a given ball is potted given its x and y coordinates
+def ball_potted(x, y):
+    for hole in holes:
+        # compares the x and y coordinates of the ball with that of each hole
+        # in order to determine if the ball is potted
+        if distance_between_points(x, y, hole[0], hole[1]) < 17:
+            return True
+    return False
+
+
+# function returns the speed given to the cue ball for the distance the player pulls the cue back
+def strike_speed(strike_distance):
+    return round((strike_distance - 10)/10)
+
+
+# function advances every moving ball by a single frame
+# tracker is the collision tracker of the balls list
+# returns a list of the events that occurred during the frame as tuples:
+# ('wall', ball index), ('pot', ball index) and ('ball', moving ball index, index of ball collided with)
+def advance_frame(balls, tracker):
+    events = []
+    for ball in balls:
+        # executes if the specific ball is on the table and moving
+        if not ball.potted and ball.speed > 0:
+            # moves the ball incrementally based on its speed
+            for i in range(int(ball.speed)):
+                # checks if the ball collides with a wall
+                if ball.y - 10 <= 150 or ball.y + 10 >= 650 or ball.x + 10 >= 1200 or ball.x - 10 <= 200:
+                    events.append(('wall', tracker.index[ball]))
+                    # ball loses speed
+                    if ball.speed > 1:
+                        ball.speed -= 1
+                    # calculates new angle of ball following collision
+                    # a ball that is already moving away from the wall keeps its direction
+                    new_direction = collision_with_wall(ball.x, ball.y, ball.movement_direction)
+                    if new_direction is not None:
+                        ball.movement_direction = new_direction
+                    # resets the monitor so that all ball collisions can occur again
+                    tracker.reset_monitor()
+                # the coordinates of the ball are translated 1 in the correct direction
+                ball.x, ball.y = angle_to_coordinates(ball.x, ball.y, ball.movement_direction, 1)
+            # moves the ball to its new grid cell
+            tracker.update(ball)
+            # checks if the ball was potted
+            if ball_potted(ball.x, ball.y):
+                events.append(('pot', tracker.index[ball]))
+                ball.potted = True
+            # stores the ball object returned from the collision checking function
+            # if None, then the code is not executed
+            ball_collided_with = check_collision_with_other_ball(ball.x, ball.y, ball, tracker)
+            if ball_collided_with is not None:
+                events.append(('ball', tracker.index[ball], tracker.index[ball_collided_with]))
+                # calls the ball collision physics function
+                # which returns the updated direction and speed of each ball involved
+                ball.movement_direction, ball_collided_with.movement_direction, ball.speed, ball_collided_with.speed = ball_collision_physics(ball.x, ball.y, ball_collided_with.x, ball_collided_with.y, ball.movement_direction, ball.speed)
+                # resets the monitor so that all ball collisions can occur again
+                # and prevents this collision from being calculated again
+                tracker.reset_monitor()
+                tracker.block(ball, ball_collided_with)
+            # ============
+            # FRICTION
+            # ============
+            # decreases the speed of the ball at time increments according to the logarithm below
+            if ball.frames >= (-30) * math.log10(0.05 * (ball.speed + 1)):
+                ball.speed -= 1
+                ball.frames = 0
+            ball.frames += 1
+    return events
+
+
+# function returns engine copies of the given balls
+# any objects with colour, x, y and potted attributes can be copied (e.g. the ball objects of main.py)
+# a TableState already creates new balls for them
+def copy_balls(table_state):
+    if hasattr(table_state, 'to_balls'):
+        return table_state.to_balls()
+    copies = []
+    for b in table_state:
+        copy = SimBall(b.colour, b.x, b.y)
+        copy.potted = b.potted
+        copy.speed = b.speed
+        copy.movement_direction = b.movement_direction
+        copy.frames = b.frames
+        copies.append(copy)
+    return copies
+
+
+# function returns engine balls in the initial rack
+def racked_balls():
+    return [SimBall(colour, x, y) for colour, x, y in RACK]
+
+
+# function advances a table frame by frame until every ball has stopped moving and tallies the events of the shot
+# advance is called once per frame and returns the events of that frame, stopped returns True once the table is at rest
+# returns the potted balls, first ball hit, frames, wall hits and ball hits in the order taken by ShotResult
+def play_out_shot(advance, stopped):
+    potted, first_ball_hit = [], None
+    frames, wall_hits, ball_hits = 0, 0, 0
+    while not stopped() and frames < MAX_SHOT_FRAMES:
+        for event in advance():
+            if event[0] == 'wall':
+                wall_hits += 1
+            elif event[0] == 'pot':
+                potted.append(event[1])
+            else:
+                ball_hits += 1
+                # updates the first ball collided with if it has not been set yet
+                if first_ball_hit is None:
+                    first_ball_hit = event[2]
+        frames += 1
+    return potted, first_ball_hit, frames, wall_hits, ball_hits
+
+
+# function simulates a shot to rest as fast as possible and returns the outcome
+# table_state is the list of balls (cue ball first), direction is in degrees and power is the speed of the cue ball
+# the balls in the table state are not modified
+def simulate_shot(table_state, direction, power):
+    balls = copy_balls(table_state)
+    # strikes the cue ball
+    balls[0].speed = power
+    balls[0].movement_direction = direction
+    tracker = CollisionTracker(balls)
+    outcome = play_out_shot(lambda: advance_frame(balls, tracker), lambda: balls_stopped(balls))
+    return ShotResult([(b.x, b.y) for b in balls], *outcome)
+
+
+# function returns the simulate_shot function of the engine mode with the given name
+# engines are imported on first use so that optional dependencies such as NumPy are only needed when used
+def get_engine(name):
+    return importlib.import_module('.' + ENGINES[name], __package__).simulate_shot
@@ -0,0 +1,156 @@
+"""
+    File: profiler.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Optional per frame profiler for the main loop. Times each phase of the frame, counts calls to the
+                 functions most used by the physics, shows rolling averages in an overlay that can be toggled on
+                 screen and writes every frame to a CSV file. Nothing is timed or counted unless it is created
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import csv
+import time
+from collections import deque, OrderedDict
+import pygame
+from . import physics
+from .broadphase import CollisionTracker
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# phases of the main loop in the order they run
+PHASES = ('events', 'physics', 'turn', 'draw', 'aiming', 'display', 'idle')
+# functions of the physics module whose calls are counted
+COUNTED_FUNCTIONS = ('check_collision_with_other_ball', 'angle_to_coordinates')
+# name the calls to CollisionTracker.reset_monitor are counted under
+MONITOR_RESET = 'collision_monitor_reset'
+# number of frames the overlay averages over
+WINDOW = 120
+# number of frames between updates of the overlay
+OVERLAY_INTERVAL = 30
+# distance of the overlay from the top right corner of the display and its colours
+OVERLAY_MARGIN = 5
+OVERLAY_TEXT = (255, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 180)
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# times the phases of each frame of the main loop and counts the calls to the physics functions
+class FrameProfiler (object):
+    def __init__(self, csv_path=None, font=None):
+        self.font = font or pygame.font.SysFont('consolas', 14)
+        # times (in seconds) and call counts of the frame being profiled
+        self.times = OrderedDict((phase, 0.0) for phase in PHASES)
+        self.counts = OrderedDict((name, 0) for name in COUNTED_FUNCTIONS + (MONITOR_RESET,))
+        # the last frames profiled as (times, counts) tuples
+        self.history = deque(maxlen=WINDOW)
+        self.frame = 0
+        self.last_mark = time.perf_counter()
+        self.show_overlay = False
+        self.overlay = None
+        self.overlay_version = 0
+        self.file = None
+        self.writer = None
+        if csv_path is not None:
+            self.file = open(csv_path, 'w', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['frame'] + [phase + '_ms' for phase in PHASES] + ['total_ms'] + list(self.counts))
+
+    # function returns a copy of a function that counts its calls under the given name
+    def counted(self, name, function):
+        counts = self.counts
+
+        def counted_function(*args, **kwargs):
+            counts[name] += 1
+            return function(*args, **kwargs)
+
+        return counted_function
+
+    # replaces the counted functions with counting copies in the physics module and the given namespaces
+    # (e.g. the globals of main.py, which imports the functions by name)
+    def install(self, *namespaces):
+        for name in COUNTED_FUNCTIONS:
+            original = getattr(physics, name)
+            counted_function = self.counted(name, original)
+            for namespace in (vars(physics),) + namespaces:
+                if namespace.get(name) is original:
+                    namespace[name] = counted_function
+        CollisionTracker.reset_monitor = self.counted(MONITOR_RESET, CollisionTracker.reset_monitor)
+
+    # adds the time since the last mark to the given phase
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.times[phase] += now - self.last_mark
+        self.last_mark = now
+
+    # finishes the frame: stores and writes its times and counts, then starts the next frame
+    def end_frame(self):
+        times = list(self.times.values())
+        counts = list(self.counts.values())
+        self.history.append((times, counts))
+        if self.writer is not None:
+            self.writer.writerow([self.frame] + ['%.4f' % (t * 1000) for t in times] + ['%.4f' % (sum(times) * 1000)]
+                                 + counts)
+        for phase in self.times:
+            self.times[phase] = 0.0
+        for name in self.counts:
+            self.counts[name] = 0
+        self.frame += 1
+        if self.show_overlay and self.frame % OVERLAY_INTERVAL == 0:
+            self.overlay = None
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay = None
+
+    # function returns the lines of the overlay: the mean and worst time of each phase and the mean counts
+    def summary(self):
+        frames = len(self.history)
+        lines = ['frame %d (last %d)' % (self.frame, frames)]
+        if frames == 0:
+            return lines
+        for i in range(len(PHASES)):
+            phase_times = [times[i] for times, counts in self.history]
+            lines.append('%-8s %6.2f ms max %6.2f' % (PHASES[i], sum(phase_times) / frames * 1000,
+                                                     max(phase_times) * 1000))
+        totals = [sum(times) for times, counts in self.history]
+        lines.append('%-8s %6.2f ms max %6.2f' % ('total', sum(totals) / frames * 1000, max(totals) * 1000))
+        names = list(self.counts)
+        for i in range(len(names)):
+            lines.append('%s %.1f' % (names[i].replace('_', ' '), sum(counts[i] for times, counts in self.history)
+                                      / frames))
+        return lines
+
+    # function renders the overlay onto a surface
+    def render_overlay(self):
+        lines = [self.font.render(line, 1, OVERLAY_TEXT) for line in self.summary()]
+        height = sum(line.get_height() for line in lines) + 10
+        surface = pygame.Surface((max(line.get_width() for line in lines) + 10, height), pygame.SRCALPHA)
+        surface.fill(OVERLAY_BACKGROUND)
+        y = 5
+        for line in lines:
+            surface.blit(line, (5, y))
+            y += line.get_height()
+        return surface
+
+    # adds the overlay to the frame if it is shown, it is only rendered again every few frames
+    def draw_overlay(self, renderer):
+        if not self.show_overlay:
+            return
+        if self.overlay is None:
+            self.overlay = self.render_overlay()
+            self.overlay_version += 1
+        surface = self.overlay
+        rect = surface.get_rect(topright=(renderer.display.get_width() - OVERLAY_MARGIN, OVERLAY_MARGIN))
+        renderer.add(('profiler', self.overlay_version), rect, lambda display: display.blit(surface, rect))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
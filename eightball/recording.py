@@ -0,0 +1,261 @@
+"""
+    File: recording.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Records every shot of a game to a compact binary file and reads it back for replays. Each frame is a
+                 fixed size record of the ball positions, speeds and potted flags, so a replay can jump to any frame
+                 of the memory mapped file. The inputs of each shot are stored as well, so that the whole game can be
+                 rebuilt by simulating it again
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import math
+import mmap
+import struct
+from .common import COLOURS, COLOUR_CODES
+from .physics import SimBall, advance_frame, balls_stopped, strike_speed
+from .broadphase import CollisionTracker
+from .rules import GameState, resolve_turn
+
+# ==================================================================================================================
+# FILE FORMAT
+# ==================================================================================================================
+# the file starts with a header: magic, version, number of balls, then the colour code, x and y of each ball
+# each shot is a shot header followed by its frames, and the file ends with an index of the shots
+MAGIC = b'8BPR'
+INDEX_MAGIC = b'8BPI'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+BALL_START = struct.Struct('<Bdd')
+# shot header: tag, cue direction, strike distance, ball in hand x and y (nan if the cue ball was not placed),
+# number of frames in the shot
+SHOT_TAG = b'S'
+SHOT_HEADER = struct.Struct('<cddddI')
+# index entry of each shot: offset of the shot header in the file and number of the shot's first frame
+INDEX_ENTRY = struct.Struct('<QQ')
+INDEX_FOOTER = struct.Struct('<I4s')
+# positions are stored in 1/32 of a pixel and speeds in 1/8 of a pixel per frame
+POSITION_SCALE = 32
+SPEED_SCALE = 8
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the struct used to pack a single frame of the given number of balls
+# each ball takes an x, y and speed, followed by the potted flags of all of the balls as a bitmask
+def frame_struct(number_of_balls):
+    return struct.Struct('<' + 'HHB' * number_of_balls + str((number_of_balls + 7) // 8) + 's')
+
+
+# function packs the state of the balls into a frame record
+def pack_frame(frame_format, balls):
+    values = []
+    potted = 0
+    for i in range(len(balls)):
+        b = balls[i]
+        values.append(min(max(int(round(b.x * POSITION_SCALE)), 0), 65535))
+        values.append(min(max(int(round(b.y * POSITION_SCALE)), 0), 65535))
+        values.append(min(max(int(round(b.speed * SPEED_SCALE)), 0), 255))
+        if b.potted:
+            potted |= 1 << i
+    values.append(potted.to_bytes((len(balls) + 7) // 8, 'little'))
+    return frame_format.pack(*values)
+
+
+# function sets up a recorded shot on the balls and plays it out, returns the events of the shot
+def play_shot(balls, tracker, shot):
+    if shot.placement is not None:
+        balls[0].x, balls[0].y = shot.placement
+        balls[0].potted = False
+        tracker.update(balls[0])
+    balls[0].speed = strike_speed(shot.strike_distance)
+    balls[0].movement_direction = shot.cue_direction
+    tracker.reset_monitor()
+    events = []
+    while not balls_stopped(balls):
+        events += advance_frame(balls, tracker)
+    return events
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# inputs of a recorded shot and where its frames are stored
+class RecordedShot (object):
+    def __init__(self, cue_direction, strike_distance, placement, first_frame, frame_count, offset):
+        self.cue_direction = cue_direction
+        self.strike_distance = strike_distance
+        # coordinates the cue ball was placed at before the shot (None if it was not in hand)
+        self.placement = placement
+        # number of the first frame of the shot within the whole game and number of frames in the shot
+        self.first_frame = first_frame
+        self.frame_count = frame_count
+        # position of the first frame of the shot in the file
+        self.offset = offset
+
+
+# writes the shots of a game to a recording file
+class ShotRecorder (object):
+    def __init__(self, path, balls):
+        self.file = open(path, 'wb')
+        self.frame_format = frame_struct(len(balls))
+        self.file.write(HEADER.pack(MAGIC, VERSION, len(balls)))
+        for b in balls:
+            self.file.write(BALL_START.pack(COLOUR_CODES[b.colour], b.x, b.y))
+        # offsets and first frames of the shots for the index
+        self.index = []
+        self.frames = 0
+        # coordinates the cue ball was placed at for the next shot
+        self.placement = None
+        # offset of the header of the shot being recorded and the number of frames recorded in it
+        self.shot_offset = None
+        self.shot_frames = 0
+
+    # stores the coordinates the cue ball was placed at while in hand, saved with the next shot
+    def place_cue_ball(self, x, y):
+        self.placement = (x, y)
+
+    # starts recording a new shot with the given inputs
+    def start_shot(self, cue_direction, strike_distance):
+        if self.shot_offset is not None:
+            self.end_shot()
+        placement = self.placement or (float('nan'), float('nan'))
+        self.shot_offset = self.file.tell()
+        self.shot_frames = 0
+        self.index.append((self.shot_offset, self.frames))
+        self.file.write(SHOT_HEADER.pack(SHOT_TAG, cue_direction, strike_distance, placement[0], placement[1], 0))
+        self.placement = None
+
+    # adds the current state of the balls to the shot being recorded
+    def record_frame(self, balls):
+        self.file.write(pack_frame(self.frame_format, balls))
+        self.shot_frames += 1
+        self.frames += 1
+
+    # finishes the shot being recorded by filling in its number of frames
+    def end_shot(self):
+        if self.shot_offset is None:
+            return
+        end = self.file.tell()
+        self.file.seek(self.shot_offset + SHOT_HEADER.size - 4)
+        self.file.write(struct.pack('<I', self.shot_frames))
+        self.file.seek(end)
+        self.shot_offset = None
+
+    # finishes the file by writing the index of the shots
+    def close(self):
+        if self.file.closed:
+            return
+        self.end_shot()
+        for offset, first_frame in self.index:
+            self.file.write(INDEX_ENTRY.pack(offset, first_frame))
+        self.file.write(INDEX_FOOTER.pack(len(self.index), INDEX_MAGIC))
+        self.file.close()
+
+
+# memory mapped recording that can be read from any frame without simulating the game again
+class Recording (object):
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, number_of_balls = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a recording file: ' + path)
+        self.number_of_balls = number_of_balls
+        self.frame_format = frame_struct(number_of_balls)
+        # colours and starting coordinates of the balls
+        self.colours, self.start = [], []
+        offset = HEADER.size
+        for i in range(number_of_balls):
+            code, x, y = BALL_START.unpack_from(self.data, offset)
+            self.colours.append(COLOURS[code])
+            self.start.append((x, y))
+            offset += BALL_START.size
+        self.shots = self.read_shots(offset)
+        self.frame_count = sum(shot.frame_count for shot in self.shots)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    # function reads the shot headers, using the index at the end of the file if it was written
+    # if the game was not closed properly the shots are found by walking through the file instead
+    def read_shots(self, offset):
+        offsets = []
+        size = len(self.data)
+        if size >= offset + INDEX_FOOTER.size:
+            count, magic = INDEX_FOOTER.unpack_from(self.data, size - INDEX_FOOTER.size)
+            if magic == INDEX_MAGIC:
+                start = size - INDEX_FOOTER.size - count * INDEX_ENTRY.size
+                offsets = [INDEX_ENTRY.unpack_from(self.data, start + i * INDEX_ENTRY.size)[0] for i in range(count)]
+                size = start
+        if not offsets:
+            while offset + SHOT_HEADER.size <= size and self.data[offset:offset + 1] == SHOT_TAG:
+                offsets.append(offset)
+                frames = SHOT_HEADER.unpack_from(self.data, offset)[5]
+                offset += SHOT_HEADER.size + frames * self.frame_format.size
+        shots = []
+        first_frame = 0
+        for offset in offsets:
+            tag, cue_direction, strike_distance, x, y, frames = SHOT_HEADER.unpack_from(self.data, offset)
+            placement = None if math.isnan(x) else (x, y)
+            # frames of an unfinished shot are counted from the size of the file
+            if frames == 0:
+                frames = (size - offset - SHOT_HEADER.size) // self.frame_format.size
+            shots.append(RecordedShot(cue_direction, strike_distance, placement, first_frame, frames,
+                                      offset + SHOT_HEADER.size))
+            first_frame += frames
+        return shots
+
+    # function returns the shot that contains the given frame
+    def shot_of_frame(self, frame):
+        low, high = 0, len(self.shots) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.shots[middle].first_frame <= frame:
+                low = middle
+            else:
+                high = middle - 1
+        return self.shots[low]
+
+    # function returns the state of the balls in the given frame as a list of (x, y, speed, potted) tuples
+    def frame(self, frame):
+        if not 0 <= frame < self.frame_count:
+            raise IndexError('frame out of range')
+        shot = self.shot_of_frame(frame)
+        values = self.frame_format.unpack_from(self.data, shot.offset + (frame - shot.first_frame) * self.frame_format.size)
+        potted = int.from_bytes(values[-1], 'little')
+        state = []
+        for i in range(self.number_of_balls):
+            state.append((values[i * 3] / POSITION_SCALE, values[i * 3 + 1] / POSITION_SCALE,
+                          values[i * 3 + 2] / SPEED_SCALE, bool(potted >> i & 1)))
+        return state
+
+    # function simulates the recorded game again from its inputs
+    # yields the balls after each shot, the same ball objects are updated every time
+    def rebuild(self):
+        balls = [SimBall(self.colours[i], self.start[i][0], self.start[i][1]) for i in range(self.number_of_balls)]
+        tracker = CollisionTracker(balls)
+        for shot in self.shots:
+            play_shot(balls, tracker, shot)
+            yield balls
+
+    # function simulates the recorded game again and returns the state of the game before each shot
+    # the last state is the state after the last shot
+    def turns(self):
+        balls = [SimBall(self.colours[i], self.start[i][0], self.start[i][1]) for i in range(self.number_of_balls)]
+        tracker = CollisionTracker(balls)
+        states = [GameState()]
+        for shot in self.shots:
+            events = play_shot(balls, tracker, shot)
+            potted = [event[1] for event in events if event[0] == 'pot']
+            hits = [event[2] for event in events if event[0] == 'ball']
+            state = resolve_turn(states[-1], potted, hits[0] if hits else None, self.colours)[0]
+            # the cue ball is placed before the next shot when it is in hand
+            states.append(state.replace(cue_ball_in_hand=False))
+        return states
@@ -0,0 +1,169 @@
+"""
+    File: renderer.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Draws the game using dirty rectangles. The table, player information and potted balls are rendered
+                 once onto a background surface, text is rendered once for each string, and each frame only the
+                 areas where something moved, appeared or disappeared are redrawn and pushed to the screen
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import pygame
+
+# ==================================================================================================================
+# COLOURS
+# ==================================================================================================================
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+FELT = (49, 185, 77)
+OAK = (79, 36, 18)
+
+# ==================================================================================================================
+# TABLE
+# ==================================================================================================================
+# coordinates and dimensions of the walls of the pool table
+WALLS = ((150, 100, 1100, 50), (150, 650, 1100, 50), (1200, 100, 50, 600), (150, 100, 50, 600))
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns a surface with the empty pool table drawn on it
+def draw_table(size, walls, holes):
+    table = pygame.Surface(size)
+    # white background
+    table.fill(WHITE)
+    # green felt for pool table
+    pygame.draw.rect(table, FELT, (200, 150, 1000, 500))
+    # draws all of the table walls
+    for wall in walls: pygame.draw.rect(table, OAK, wall)
+    # draws each of the six pockets
+    for hole in holes: pygame.draw.circle(table, BLACK, hole, 22)
+    return table
+
+
+# function returns the texts and sprites of the background: the player and turn information at the top of the
+# display and the sprites of the potted balls on the lower left portion of the screen
+def background_items(player_turn, colours, potted_sprites):
+    texts = [('PLAYER 1', BLACK, (20, 10)), (colours[0].upper(), BLACK, (20, 50)),
+             ('PLAYER 2', BLACK, (1260, 10)), (colours[1].upper(), BLACK, (1260, 50)),
+             ('PLAYER ' + str(player_turn) + '\'S TURN', RED, (600, 10))]
+    sprites = [(potted_sprites[index], (250 + (index * 25), 750)) for index in range(len(potted_sprites))]
+    return texts, sprites
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# renderer that only redraws and updates the parts of the display that changed since the last frame
+class Renderer (object):
+    def __init__(self, display, font, walls, holes):
+        self.display = display
+        self.font = font
+        # the empty table, drawn once
+        self.table = draw_table(display.get_size(), walls, holes)
+        # the table with the player information and potted balls drawn on it
+        self.background = self.table.copy()
+        self.background_key = None
+        # rendered text surfaces keyed by (text, colour)
+        self.text_surfaces = {}
+        # items drawn this frame and the rectangles of the items drawn last frame, keyed by what was drawn
+        self.items = []
+        self.previous = {}
+        # whether the whole display has to be redrawn in the next update
+        self.full_redraw = True
+
+    # function returns the rendered surface of a string, rendering it only the first time it is used
+    def text(self, string, colour):
+        key = (string, colour)
+        if key not in self.text_surfaces:
+            self.text_surfaces[key] = self.font.render(string, 1, colour)
+        return self.text_surfaces[key]
+
+    # sets the parts of the frame that only change between turns
+    # texts is a list of (string, colour, position) tuples and sprites is a list of (surface, position) tuples
+    # the background is only redrawn if either of them changed
+    def set_background(self, texts, sprites):
+        key = (tuple(texts), tuple((id(surface), position) for surface, position in sprites))
+        if key == self.background_key:
+            return
+        self.background_key = key
+        self.background = self.table.copy()
+        for string, colour, position in texts:
+            self.background.blit(self.text(string, colour), position)
+        for surface, position in sprites:
+            self.background.blit(surface, position)
+        self.full_redraw = True
+
+    # adds an item to the frame, draw is called with the display whenever the item has to be drawn
+    def add(self, key, rect, draw):
+        self.items.append((key, rect, draw))
+
+    # draws a surface at the given position
+    def blit(self, surface, position):
+        rect = surface.get_rect(topleft=(int(position[0]), int(position[1])))
+        self.add(('blit', id(surface), rect.topleft), rect, lambda display: display.blit(surface, position))
+
+    # draws a line between two points
+    def line(self, colour, start, end, width):
+        rect = pygame.Rect(min(start[0], end[0]), min(start[1], end[1]), abs(end[0] - start[0]), abs(end[1] - start[1]))
+        rect.inflate_ip(width * 2 + 2, width * 2 + 2)
+        self.add(('line', colour, tuple(start), tuple(end), width), rect,
+                 lambda display: pygame.draw.line(display, colour, start, end, width))
+
+    # draws a circle with the given centre and radius
+    def circle(self, colour, centre, radius, width=0):
+        rect = pygame.Rect(0, 0, radius * 2 + 2, radius * 2 + 2)
+        rect.center = (int(centre[0]), int(centre[1]))
+        self.add(('circle', colour, tuple(centre), radius, width), rect,
+                 lambda display: pygame.draw.circle(display, colour, centre, radius, width))
+
+    # draws the whole frame onto the display without updating the screen, used to render frames off-screen
+    def render(self):
+        items, self.items = self.items, []
+        self.display.blit(self.background, (0, 0))
+        for key, rect, draw in items:
+            draw(self.display)
+
+    # draws the changed parts of the frame and updates them on the screen
+    def update(self):
+        items, self.items = self.items, []
+        current = {}
+        for key, rect, draw in items:
+            current[key] = rect
+        if self.full_redraw:
+            self.full_redraw = False
+            self.display.blit(self.background, (0, 0))
+            for key, rect, draw in items:
+                draw(self.display)
+            pygame.display.update()
+            self.previous = current
+            return
+        # areas where an item disappeared or appeared
+        dirty = [rect for key, rect in self.previous.items() if key not in current]
+        dirty += [rect for key, rect, draw in items if key not in self.previous]
+        if not dirty:
+            return
+        # items that were already drawn are redrawn if they overlap a changed area
+        redraw = [False] * len(items)
+        changed = True
+        while changed:
+            changed = False
+            for i in range(len(items)):
+                if not redraw[i] and (items[i][0] not in self.previous or items[i][1].collidelist(dirty) != -1):
+                    redraw[i] = True
+                    dirty.append(items[i][1])
+                    changed = True
+        # restores the background in the changed areas and draws the items in them, in order
+        for rect in dirty:
+            self.display.blit(self.background, rect, rect)
+        for i in range(len(items)):
+            if redraw[i]:
+                items[i][2](self.display)
+        pygame.display.update(dirty)
+        self.previous = current
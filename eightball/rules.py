@@ -0,0 +1,149 @@
+"""
+    File: rules.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: The rules of 8 ball pool. Given the state of a game and the outcome of a shot, works out the colours
+                 of the players, whether the turn changes, whether the next player has the ball in hand and who
+                 wins, without changing anything else. Used by the game, the server and the computer player
+"""
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# state of a game between shots, players are numbered 1 and 2
+# states are never changed once created, resolving a turn returns a new state
+class GameState (object):
+    __slots__ = ('player_turn', 'colours', 'only_eight_ball_left', 'initial_break', 'cue_ball_in_hand', 'winner',
+                 'potted')
+
+    def __init__(self, player_turn=1, colours=('', ''), only_eight_ball_left=(False, False), initial_break=True,
+                 cue_ball_in_hand=False, winner=None, potted=0):
+        # number of the player taking the next shot
+        self.player_turn = player_turn
+        # colour (stripes or solids) of each player, empty until assigned
+        self.colours = colours
+        # whether each player only has the eight ball left
+        self.only_eight_ball_left = only_eight_ball_left
+        # whether the colours have not been assigned yet
+        self.initial_break = initial_break
+        # whether the player taking the next shot has the cue ball in hand
+        self.cue_ball_in_hand = cue_ball_in_hand
+        # number of the winning player (None while the game is being played)
+        self.winner = winner
+        # bitmask of the object balls potted over the course of the game, bit i is set if ball i is potted
+        self.potted = potted
+
+    # function returns a copy of the state with the given values changed
+    def replace(self, **changes):
+        values = dict((name, getattr(self, name)) for name in self.__slots__)
+        values.update(changes)
+        return GameState(**values)
+
+    # function returns the colour of a player
+    def colour(self, player):
+        return self.colours[player - 1]
+
+    # function returns the colour the player taking the next shot has to hit first (None if any ball may be hit first)
+    def target(self):
+        if self.only_eight_ball_left[self.player_turn - 1]:
+            return 'eight'
+        colour = self.colour(self.player_turn)
+        return colour or None
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the number of potted balls of the given colour in a bitmask of potted balls
+def number_of_balls_potted(potted, ball_colours, colour):
+    total = 0
+    for i in range(len(ball_colours)):
+        if potted >> i & 1 and ball_colours[i] == colour:
+            total += 1
+    return total
+
+
+# function resolves the turn after a shot
+# potted is the list of indices of the balls potted during the shot in the order they were potted (0 is the cue ball),
+# first_ball_hit is the index of the first ball hit by the cue ball (None if no ball was hit)
+# and ball_colours is the colour of every ball on the table
+# returns the new state and a list of events: ('colours', player, colour) when the colours are assigned,
+# ('win', player), ('eight_ball_left', player), ('ball_in_hand', player) and ('turn', player) when the turn changes
+def resolve_turn(state, potted, first_ball_hit, ball_colours):
+    events = []
+    player = state.player_turn
+    other_player = 2 if player == 1 else 1
+    colours = state.colours
+    initial_break = state.initial_break
+    first_colour = None if first_ball_hit is None else ball_colours[first_ball_hit]
+    cue_ball_potted = 0 in potted
+    all_potted = state.potted
+    for i in potted:
+        if i != 0:
+            all_potted |= 1 << i
+
+    # ===================================
+    # CHECKS POTTED BALLS AFTER EACH TURN
+    # ===================================
+    stripes, solids = 0, 0
+    for i in potted:
+        colour = ball_colours[i]
+        if colour in ('stripes', 'solids'):
+            if colour == 'stripes':
+                stripes += 1
+            else:
+                solids += 1
+            # the colours are assigned based on which player potted the first stripes or solids ball
+            if initial_break:
+                initial_break = False
+                other_colour = 'solids' if colour == 'stripes' else 'stripes'
+                colours = (colour, other_colour) if player == 1 else (other_colour, colour)
+                events.append(('colours', player, colour))
+        # if the ball potted is the eight ball, the game is over
+        # the player wins only if it was their last ball, the cue ball was not potted and the eight ball was hit first
+        elif colour == 'eight':
+            if state.only_eight_ball_left[player - 1] and not cue_ball_potted and first_colour == 'eight':
+                winner = player
+            else:
+                winner = other_player
+            events.append(('win', winner))
+            return state.replace(colours=colours, initial_break=initial_break, winner=winner, potted=all_potted), events
+
+    # =============================================================
+    # DETERMINES WHETHER PLAYER TURN CHANGES AND IF BALL IS IN HAND
+    # =============================================================
+    only_eight_ball_left = state.only_eight_ball_left
+    turn_change = True
+    cue_ball_in_hand = False
+    # the player did not pot the eight ball, ball in hand is given if the eight ball was not hit first
+    if only_eight_ball_left[player - 1]:
+        cue_ball_in_hand = first_colour != 'eight'
+    else:
+        # the turn only stays with the player if they potted a ball of their colour
+        player_colour = colours[player - 1]
+        if player_colour == 'stripes':
+            turn_change = stripes == 0
+        elif player_colour == 'solids':
+            turn_change = solids == 0
+        # hitting no ball or a ball of the wrong colour first gives the ball in hand
+        if first_colour is None or (player_colour in ('stripes', 'solids') and first_colour != player_colour):
+            turn_change = True
+            cue_ball_in_hand = True
+        # checks whether the player only has the eight ball left
+        if player_colour and number_of_balls_potted(all_potted, ball_colours, player_colour) == 7:
+            only_eight_ball_left = tuple(True if p == player else only_eight_ball_left[p - 1] for p in (1, 2))
+            events.append(('eight_ball_left', player))
+    # potting the cue ball changes the turn and gives the ball in hand
+    if cue_ball_potted:
+        turn_change = True
+        cue_ball_in_hand = True
+    next_player = other_player if turn_change else player
+    if turn_change:
+        events.append(('turn', next_player))
+    if cue_ball_in_hand:
+        events.append(('ball_in_hand', next_player))
+    return GameState(next_player, colours, only_eight_ball_left, initial_break, cue_ball_in_hand, None,
+                     all_potted), events
@@ -0,0 +1,62 @@
+"""
+    File: scheduler.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Decides when the game draws a frame. While something is moving frames are drawn at a capped frame
+                 rate, and while nothing is moving and nothing changed the game sleeps until the next input event
+                 instead of redrawing the same frame
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import pygame
+from pygame.locals import NOEVENT
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# draws frames only when they can differ from the last one
+class FrameScheduler (object):
+    def __init__(self, clock, fps=60):
+        self.clock = clock
+        self.fps = fps
+        # whether the next frame has to be drawn even if nothing is moving
+        self.dirty = True
+        # event that woke the game from sleeping, handed out before the events still in the queue
+        self.pending = []
+        # number of times the game slept waiting for input
+        self.idle_waits = 0
+
+    # makes sure the next frame is drawn, called whenever an input event or a change of state may change the frame
+    def request_redraw(self):
+        self.dirty = True
+
+    # waits until there is a reason to draw the next frame
+    # returns at once if animating is True or a redraw was requested, otherwise sleeps until an input event arrives
+    # the event that woke the game is returned by the next call to events, so the frame that follows shows its effect
+    def wait(self, animating):
+        if animating or self.dirty:
+            self.dirty = False
+            return
+        self.idle_waits += 1
+        event = pygame.event.wait()
+        if event.type != NOEVENT:
+            self.pending.append(event)
+        # the time spent sleeping does not count as part of the next frame
+        self.clock.tick()
+
+    # function returns the input events of the frame in the order they arrived
+    # the frame after any input is drawn, since handling the input may change it
+    def events(self):
+        events, self.pending = self.pending, []
+        events += pygame.event.get()
+        if events:
+            self.dirty = True
+        return events
+
+    # caps the frame rate, returns the seconds taken by the frame
+    def tick(self):
+        return self.clock.tick(self.fps) / 1000
@@ -0,0 +1,331 @@
+"""
+    File: server.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Game server hosting many tables at once without a display. Players connect over a local socket and
+                 send newline separated JSON messages to create and join tables, place the cue ball and take shots.
+                 Shots are simulated in a pool of worker processes, each table keeps its own turn, colours, ball in
+                 hand and winner, and the resulting table state is sent to every player at the table
+                 Usage: python -m eightball serve [--port N] [--processes N]
+                        python -m eightball serve --load-test TABLES SHOTS [--processes N]
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import sys
+import json
+import time
+import random
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from .common import option, percentile
+from .physics import racked_balls, strike_speed, touching_other_ball
+from .table_state import TableState, simulate_table_shot
+from .rules import GameState, resolve_turn
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+HOST = '127.0.0.1'
+PORT = 8808
+# the game caps the strike distance at 210 and only registers a shot above 10
+MIN_STRIKE_DISTANCE = 10
+MAX_STRIKE_DISTANCE = 210
+# seconds a closing connection is given to write its last replies
+CLOSE_TIMEOUT = 1.0
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# a single game of 8 ball pool, resolved with the same rules as main.py
+class Table (object):
+    def __init__(self, table_id):
+        self.table_id = table_id
+        self.balls = racked_balls()
+        self.ball_colours = [b.colour for b in self.balls]
+        # player turn, colours, ball in hand and winner of the game
+        self.game = GameState()
+        self.shots = 0
+        # only one shot is simulated at a time for each table
+        self.lock = asyncio.Lock()
+        # queues of the players connected to the table
+        self.subscribers = set()
+
+    # function returns an error message if the player may not take a shot now (None if they may)
+    def shot_error(self, player):
+        if self.game.winner is not None:
+            return 'game over'
+        if player != self.game.player_turn:
+            return 'not your turn'
+        if self.game.cue_ball_in_hand:
+            return 'cue ball in hand'
+        return None
+
+    # function moves the cue ball while it is in hand, returns an error message if it cannot be placed there
+    def place_cue_ball(self, player, x, y):
+        if self.game.winner is not None:
+            return 'game over'
+        if player != self.game.player_turn:
+            return 'not your turn'
+        if not self.game.cue_ball_in_hand:
+            return 'cue ball not in hand'
+        if not (210 < x < 1190 and 160 < y < 640):
+            return 'off the table'
+        cue_ball = self.balls[0]
+        if touching_other_ball(x, y, cue_ball, self.balls):
+            return 'touching another ball'
+        cue_ball.x, cue_ball.y = x, y
+        self.game = self.game.replace(cue_ball_in_hand=False)
+        return None
+
+    # updates the table after a shot given its outcome and the balls at rest, returns the events of the turn
+    def resolve(self, result, balls):
+        self.balls = balls
+        self.shots += 1
+        self.game, events = resolve_turn(self.game, result.potted, result.first_ball_hit, self.ball_colours)
+        # a potted cue ball is taken back out of the pocket
+        balls[0].potted = False
+        return events
+
+    # function returns the state of the table as a dictionary that can be sent as JSON
+    def state(self):
+        return {'table': self.table_id, 'shots': self.shots,
+                'balls': [[b.x, b.y, b.potted] for b in self.balls],
+                'player_turn': self.game.player_turn, 'colours': list(self.game.colours),
+                'initial_break': self.game.initial_break, 'cue_ball_in_hand': self.game.cue_ball_in_hand,
+                'winner': self.game.winner}
+
+
+# asyncio server hosting the tables
+class GameServer (object):
+    def __init__(self, host=HOST, port=PORT, processes=None):
+        self.host = host
+        self.port = port
+        self.processes = processes or multiprocessing.cpu_count()
+        self.executor = None
+        self.server = None
+        self.tables = {}
+        self.next_table_id = 1
+        # seconds from receiving each shot to sending its result
+        self.latencies = []
+        # writers and handler tasks of the connected clients
+        self.connections = {}
+
+    async def start(self):
+        self.executor = ProcessPoolExecutor(self.processes)
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # the port is looked up in case the server was started on port 0
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    # stops the server, closing the connections of the clients still connected
+    async def close(self):
+        self.server.close()
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+        self.executor.shutdown()
+
+    # function returns the statistics of the server
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {'tables': len(self.tables), 'processes': self.processes, 'shots': len(latencies),
+                'tables_per_core': len(self.tables) / self.processes,
+                'mean_latency_ms': sum(latencies) / len(latencies) * 1000 if latencies else 0,
+                'p99_latency_ms': percentile(latencies, 0.99) * 1000}
+
+    # sends the state of a table to every player at the table
+    def broadcast(self, table, message):
+        for queue in table.subscribers:
+            queue.put_nowait(message)
+
+    # simulates a shot in a worker process and updates the table with the outcome
+    async def shoot(self, table, player, direction, strike_distance):
+        received = time.perf_counter()
+        async with table.lock:
+            error = table.shot_error(player)
+            if error is not None:
+                return {'error': error}
+            strike_distance = min(strike_distance, MAX_STRIKE_DISTANCE)
+            if strike_distance <= MIN_STRIKE_DISTANCE:
+                return {'error': 'strike too soft'}
+            loop = asyncio.get_running_loop()
+            result, state = await loop.run_in_executor(self.executor, simulate_table_shot, TableState(table.balls),
+                                                       direction % 360, strike_speed(strike_distance))
+            events = table.resolve(result, state.to_balls())
+        self.latencies.append(time.perf_counter() - received)
+        message = {'event': 'shot', 'player': player, 'potted': result.potted, 'first_ball_hit': result.first_ball_hit,
+                   'frames': result.frames, 'events': events, 'state': table.state()}
+        self.broadcast(table, message)
+        return message
+
+    # function handles a message from a client and returns the reply
+    async def handle_message(self, message, queue):
+        op = message.get('op')
+        if op == 'create':
+            table = Table(self.next_table_id)
+            self.tables[table.table_id] = table
+            self.next_table_id += 1
+            return {'event': 'created', 'state': table.state()}
+        if op == 'stats':
+            return {'event': 'stats', 'stats': self.stats()}
+        table = self.tables.get(message.get('table'))
+        if table is None:
+            return {'error': 'no such table'}
+        if op == 'join':
+            table.subscribers.add(queue)
+            return {'event': 'joined', 'state': table.state()}
+        if op == 'state':
+            return {'event': 'state', 'state': table.state()}
+        if op == 'place':
+            async with table.lock:
+                error = table.place_cue_ball(message['player'], message['x'], message['y'])
+            if error is not None:
+                return {'error': error}
+            message = {'event': 'placed', 'state': table.state()}
+            self.broadcast(table, message)
+            # players at the table already receive the placement
+            return message if queue not in table.subscribers else None
+        if op == 'shoot':
+            reply = await self.shoot(table, message['player'], message['direction'], message['strike_distance'])
+            # players at the table already receive the result
+            return reply if 'error' in reply or queue not in table.subscribers else None
+        return {'error': 'unknown op'}
+
+    # reads the messages of a client and writes back replies and table updates
+    async def handle_client(self, reader, writer):
+        self.connections[asyncio.current_task()] = writer
+        queue = asyncio.Queue()
+
+        # writes the queued messages until the None put on the queue when the connection is closed
+        async def send():
+            while True:
+                message = await queue.get()
+                if message is None:
+                    return
+                writer.write((json.dumps(message) + '\n').encode())
+                await writer.drain()
+
+        sender = asyncio.ensure_future(send())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    reply = await self.handle_message(message, queue)
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {'error': 'bad message: ' + str(e)}
+                if reply is not None:
+                    queue.put_nowait(reply)
+        finally:
+            for table in self.tables.values():
+                table.subscribers.discard(queue)
+            # lets the last replies be written before the connection is closed, the sender has already stopped if
+            # the client went away while replies were being written
+            queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(sender, CLOSE_TIMEOUT)
+            except (OSError, asyncio.TimeoutError):
+                pass
+            writer.close()
+            del self.connections[asyncio.current_task()]
+
+
+# loopback client used to play against the server
+class Client (object):
+    def __init__(self, host=HOST, port=PORT):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def send(self, **message):
+        self.writer.write((json.dumps(message) + '\n').encode())
+        await self.writer.drain()
+
+    async def receive(self):
+        return json.loads(await self.reader.readline())
+
+    # function sends a message and returns the next message received
+    async def request(self, **message):
+        await self.send(**message)
+        return await self.receive()
+
+
+# plays a table with random shots until the game is won or the number of shots is reached
+async def play_table(port, shots, seed):
+    rng = random.Random(seed)
+    client = Client(port=port)
+    await client.connect()
+    state = (await client.request(op='create'))['state']
+    table_id = state['table']
+    await client.request(op='join', table=table_id)
+    for i in range(shots):
+        if state['winner'] is not None:
+            break
+        player = state['player_turn']
+        # places the cue ball at a random spot until one is clear of the other balls
+        while state['cue_ball_in_hand']:
+            reply = await client.request(op='place', table=table_id, player=player,
+                                         x=rng.uniform(220, 1180), y=rng.uniform(170, 630))
+            if 'state' in reply:
+                state = reply['state']
+        reply = await client.request(op='shoot', table=table_id, player=player, direction=rng.uniform(0, 360),
+                                     strike_distance=rng.uniform(30, MAX_STRIKE_DISTANCE))
+        state = reply['state']
+    await client.close()
+    return state
+
+
+# starts a server and plays the given number of tables at once from loopback clients, returning the server stats
+async def load_test(tables, shots, processes=None):
+    server = GameServer(port=0, processes=processes)
+    await server.start()
+    start = time.perf_counter()
+    await asyncio.gather(*[play_table(server.port, shots, seed) for seed in range(tables)])
+    stats = server.stats()
+    stats['seconds'] = time.perf_counter() - start
+    stats['shots_per_second'] = stats['shots'] / stats['seconds']
+    await server.close()
+    return stats
+
+
+async def serve(port, processes):
+    server = GameServer(port=port, processes=processes)
+    await server.start()
+    print('serving on %s:%d with %d processes' % (server.host, server.port, server.processes))
+    await server.server.serve_forever()
+
+
+def main():
+    processes = int(option('--processes', 0)) or None
+    if '--load-test' in sys.argv:
+        index = sys.argv.index('--load-test')
+        stats = asyncio.run(load_test(int(sys.argv[index + 1]), int(sys.argv[index + 2]), processes))
+        print(json.dumps(stats, indent=2, sort_keys=True))
+    else:
+        asyncio.run(serve(int(option('--port', PORT)), processes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+    File: shot_cache.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Cache of simulated shot outcomes. A shot is keyed by the positions, speeds, directions and potted
+                 state of the balls rounded to a set resolution together with the direction and power of the shot,
+                 so a shot that was already simulated from the same layout is looked up instead of simulated again.
+                 The least recently used outcomes are dropped once the cache reaches its memory limit, and outcomes
+                 can also be kept in a file so that the cache is still warm after a restart
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import pickle
+import sqlite3
+from collections import OrderedDict
+from .physics import get_engine
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# positions and speeds are rounded to 1/32 of a pixel and directions to 1/100 of a degree
+POSITION_RESOLUTION = 1 / 32
+DIRECTION_RESOLUTION = 1 / 100
+MAX_BYTES = 32 * 1024 * 1024
+# seconds a process waits for another process writing to the same cache file
+FILE_TIMEOUT = 30
+# number of new outcomes written to the cache file in each transaction, every commit waits for the disk
+SAVE_BATCH = 256
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns a hashable key of the state of the balls, with every value rounded to the given resolutions
+def layout_key(table_state, position_resolution=POSITION_RESOLUTION, direction_resolution=DIRECTION_RESOLUTION):
+    key = []
+    for b in table_state:
+        key += (b.colour, round(b.x / position_resolution), round(b.y / position_resolution), b.potted)
+        # the speeds and directions matter when balls are still moving, and the friction frames carry over between
+        # shots
+        key += (round(b.speed / position_resolution), round(b.movement_direction / direction_resolution), b.frames)
+    return tuple(key)
+
+
+# per process caches returned by cached_engine, keyed by the engine name and cache file
+caches = {}
+
+
+# function returns the cache of the given engine and cache file for the process, creating it the first time
+# used by the worker processes so that each of them keeps one cache between the jobs it is given
+def cached_engine(engine, path=None):
+    if (engine, path) not in caches:
+        caches[(engine, path)] = ShotCache(engine, path=path)
+    return caches[(engine, path)]
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# cache of the outcomes of shots simulated with one engine
+# the cache can be called in place of the simulate_shot function of the engine
+class ShotCache (object):
+    def __init__(self, engine='step', max_bytes=MAX_BYTES, path=None, position_resolution=POSITION_RESOLUTION,
+                 direction_resolution=DIRECTION_RESOLUTION):
+        self.engine = engine
+        self.simulate_shot = get_engine(engine)
+        self.max_bytes = max_bytes
+        self.position_resolution = position_resolution
+        self.direction_resolution = direction_resolution
+        # outcomes as (shot result, size in bytes) tuples in least to most recently used order
+        self.outcomes = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.file_hits = 0
+        self.evictions = 0
+        # file the outcomes are also stored in (None if they are only kept in memory)
+        # and the rows of the new outcomes that have not been written to it yet
+        self.connection = None
+        self.unsaved = []
+        if path is not None:
+            self.connection = sqlite3.connect(path, timeout=FILE_TIMEOUT)
+            self.connection.execute('CREATE TABLE IF NOT EXISTS outcomes (engine TEXT, key BLOB, outcome BLOB, '
+                                    'PRIMARY KEY (engine, key))')
+            self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    # function returns the outcome of a shot, simulating it only if it is not cached
+    # takes the same parameters as the simulate_shot functions of the engines
+    def __call__(self, table_state, direction, power):
+        key = self.key(table_state, direction, power)
+        entry = self.outcomes.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.outcomes.move_to_end(key)
+            return entry[0]
+        data = self.load(key)
+        if data is not None:
+            self.file_hits += 1
+            result = pickle.loads(data)
+        else:
+            self.misses += 1
+            result = self.simulate_shot(table_state, direction, power)
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+            self.save(key, data)
+        self.store(key, result, len(key) * 8 + len(data))
+        return result
+
+    # function returns the cache key of a shot
+    def key(self, table_state, direction, power):
+        return layout_key(table_state, self.position_resolution, self.direction_resolution) + \
+            (round(direction / self.direction_resolution), power)
+
+    # stores an outcome, dropping the least recently used outcomes if the cache is over its memory limit
+    def store(self, key, result, size):
+        self.outcomes[key] = (result, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self.outcomes) > 1:
+            self.bytes -= self.outcomes.popitem(last=False)[1][1]
+            self.evictions += 1
+
+    # function returns the pickled outcome of a shot from the cache file (None if it is not there)
+    def load(self, key):
+        if self.connection is None:
+            return None
+        row = self.connection.execute('SELECT outcome FROM outcomes WHERE engine = ? AND key = ?',
+                                      (self.engine, pickle.dumps(key, 4))).fetchone()
+        return None if row is None else row[0]
+
+    # adds a new outcome to the cache file, the outcomes are written in batches of SAVE_BATCH
+    def save(self, key, data):
+        if self.connection is not None:
+            self.unsaved.append((self.engine, pickle.dumps(key, 4), data))
+            if len(self.unsaved) >= SAVE_BATCH:
+                self.flush()
+
+    # writes the outcomes that have not been saved yet to the cache file in a single transaction
+    def flush(self):
+        if self.connection is not None and self.unsaved:
+            self.connection.executemany('INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?)', self.unsaved)
+            self.connection.commit()
+            self.unsaved = []
+
+    # function returns the counters of the cache as a dictionary
+    def stats(self):
+        lookups = self.hits + self.file_hits + self.misses
+        return {'engine': self.engine, 'outcomes': len(self.outcomes), 'bytes': self.bytes, 'hits': self.hits,
+                'file_hits': self.file_hits, 'misses': self.misses, 'evictions': self.evictions,
+                'hit_rate': (self.hits + self.file_hits) / lookups if lookups else 0}
+
+    def clear(self):
+        self.outcomes.clear()
+        self.bytes = 0
+
+    def close(self):
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,144 @@
+"""
+    File: table_state.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Compact copy of the state of a table. The positions, directions, speeds and friction frames of the
+                 balls are stored in arrays and the potted balls as a bitmask, so that a table can be cloned and
+                 serialized without copying a ball object for every ball. Used wherever the table is copied over and
+                 over, such as the shot search and the tournament. The collision monitor is not stored, it is always
+                 reset when a shot is taken
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import struct
+from array import array
+from .common import COLOURS, COLOUR_CODES
+from .physics import SimBall, ShotResult, copy_balls, advance_frame, balls_stopped, play_out_shot
+from .broadphase import CollisionTracker
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# serialized header: number of balls, then the size in bytes of the potted bitmask
+HEADER = struct.Struct('<HH')
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function returns the table state stored in bytes returned by TableState.to_bytes
+def load_table_state(data):
+    number_of_balls, potted_size = HEADER.unpack_from(data, 0)
+    state = TableState()
+    offset = HEADER.size
+    state.colours = tuple(COLOURS[code] for code in data[offset:offset + number_of_balls])
+    offset += number_of_balls
+    for name, typecode in (('x', 'd'), ('y', 'd'), ('direction', 'd'), ('speed', 'd'), ('frames', 'q')):
+        values = array(typecode)
+        size = number_of_balls * values.itemsize
+        values.frombytes(data[offset:offset + size])
+        setattr(state, name, values)
+        offset += size
+    state.potted = int.from_bytes(data[offset:offset + potted_size], 'little')
+    return state
+
+
+# function simulates a shot with the step engine and returns its outcome and the state of the balls after it
+# unlike physics.simulate_shot the state of the balls is returned too, since their speeds and frames carry over to the
+# next shot
+def simulate_table_shot(table_state, direction, power):
+    balls = copy_balls(table_state)
+    balls[0].speed = power
+    balls[0].movement_direction = direction
+    tracker = CollisionTracker(balls)
+    outcome = play_out_shot(lambda: advance_frame(balls, tracker), lambda: balls_stopped(balls))
+    return ShotResult([(b.x, b.y) for b in balls], *outcome), TableState(balls)
+
+# ==================================================================================================================
+# CLASSES
+# ==================================================================================================================
+
+
+# the balls of a table stored as arrays and bitmasks
+# indexing or iterating over a table state gives engine balls, so it can be passed to any engine in place of a list
+class TableState (object):
+    __slots__ = ('colours', 'x', 'y', 'direction', 'speed', 'frames', 'potted')
+
+    # creates the state of the given balls (an empty state if no balls are given)
+    def __init__(self, balls=()):
+        # the colours never change during a game, so the tuple is shared between clones
+        self.colours = tuple(b.colour for b in balls)
+        self.x = array('d', [b.x for b in balls])
+        self.y = array('d', [b.y for b in balls])
+        self.direction = array('d', [b.movement_direction for b in balls])
+        self.speed = array('d', [b.speed for b in balls])
+        self.frames = array('q', [b.frames for b in balls])
+        # bit i is set if ball i is potted
+        self.potted = 0
+        for i in range(len(balls)):
+            if balls[i].potted:
+                self.potted |= 1 << i
+
+    def __len__(self):
+        return len(self.colours)
+
+    # function returns an engine ball with the state of the ball at the given index (a list of them for a slice)
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.ball(i) for i in range(len(self.colours))[index]]
+        return self.ball(index)
+
+    def __iter__(self):
+        for i in range(len(self.colours)):
+            yield self.ball(i)
+
+    # pickles as a single bytes object
+    def __reduce__(self):
+        return load_table_state, (self.to_bytes(),)
+
+    # copy.copy clones the arrays instead of going through the pickled bytes
+    def __copy__(self):
+        return self.clone()
+
+    # function returns an engine ball with the state of the ball at the given index
+    def ball(self, i):
+        b = SimBall(self.colours[i], self.x[i], self.y[i])
+        b.movement_direction = self.direction[i]
+        b.speed = self.speed[i]
+        b.frames = self.frames[i]
+        b.potted = bool(self.potted >> i & 1)
+        return b
+
+    # function returns engine balls with the state of every ball
+    def to_balls(self):
+        return [self.ball(i) for i in range(len(self.colours))]
+
+    def set_potted(self, i, potted):
+        if potted:
+            self.potted |= 1 << i
+        else:
+            self.potted &= ~(1 << i)
+
+    # function returns a copy of the state, the arrays are copied by slicing and the colours are shared
+    def clone(self):
+        state = TableState()
+        state.colours = self.colours
+        state.x = self.x[:]
+        state.y = self.y[:]
+        state.direction = self.direction[:]
+        state.speed = self.speed[:]
+        state.frames = self.frames[:]
+        state.potted = self.potted
+        return state
+
+    # function returns the state as bytes that can be read back with load_table_state
+    def to_bytes(self):
+        number_of_balls = len(self.colours)
+        potted = self.potted.to_bytes((number_of_balls + 7) // 8, 'little')
+        return b''.join((HEADER.pack(number_of_balls, len(potted)),
+                         bytes(COLOUR_CODES[colour] for colour in self.colours),
+                         self.x.tobytes(), self.y.tobytes(), self.direction.tobytes(), self.speed.tobytes(),
+                         self.frames.tobytes(), potted))
@@ -0,0 +1,225 @@
+"""
+    File: tournament.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Headless self-play tournament between two bot policies. Complete games are played from the initial
+                 rack to a winner in worker processes on every core, the players swap the break every game and the
+                 result of each game is written as a line of JSON as soon as it finishes, so that a partial run can
+                 still be read. Reports the win rates, break outcomes, foul rates, game lengths and shots per second
+                 Usage: python -m eightball tournament [--games N] [--players POLICY POLICY] [--engine ENGINE]
+                                                       [--processes N] [--max-shots N] [--output FILE] [--seed N]
+                                                       [--shot-cache FILE]
+                        python -m eightball tournament --summarize FILE
+                 Policies: random, greedy:N (the best of N sampled shots, scored like the computer player)
+                 The engine is used by the policies to simulate candidate shots. The shots played are always
+                 simulated with the step engine and the balls keep their speeds and friction frames from one shot to
+                 the next, as in the game
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import sys
+import json
+import time
+import random
+import multiprocessing
+from .common import option, option_values
+from .physics import racked_balls, strike_speed
+from .table_state import TableState, simulate_table_shot
+from .rules import GameState, resolve_turn
+from .shot_cache import cached_engine
+from .ai import evaluate_candidates, score_shot, sample_candidates, place_cue_ball, MIN_STRIKE_DISTANCE, \
+    MAX_STRIKE_DISTANCE
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+GAMES = 1000
+PLAYERS = ('greedy:16', 'random')
+# a game still going after this many shots is recorded as a draw
+MAX_SHOTS = 500
+# number of games between progress reports
+PROGRESS_INTERVAL = 100
+
+# ==================================================================================================================
+# POLICIES
+# ==================================================================================================================
+# every policy returns the (cue_direction, strike_distance) of the next shot given the table state and game state
+
+
+# shoots in a random direction with a random strength
+def random_policy(table_state, game, engine):
+    return random.uniform(0, 360), random.uniform(MIN_STRIKE_DISTANCE, MAX_STRIKE_DISTANCE)
+
+
+# simulates the given number of candidate shots, sampled like the computer player, and takes the best scoring one
+def greedy_policy(table_state, game, engine, count, shot_cache_path=None):
+    best, best_score = None, None
+    candidates = sample_candidates(table_state, game, count)
+    for cue_direction, strike_distance, result in evaluate_candidates(table_state, engine, candidates,
+                                                                      shot_cache_path):
+        score = score_shot(result, table_state.colours, game)
+        if best_score is None or score > best_score:
+            best, best_score = (cue_direction, strike_distance), score
+    return best
+
+
+# function returns the policy function described by a name such as 'random' or 'greedy:16'
+# policies that simulate shots keep them in the shot cache file if one is given
+def get_policy(name, shot_cache_path=None):
+    kind, _, argument = name.partition(':')
+    if kind == 'random':
+        return random_policy
+    if kind == 'greedy':
+        count = int(argument or 16)
+        return lambda table_state, game, engine: greedy_policy(table_state, game, engine, count, shot_cache_path)
+    raise ValueError('unknown policy: ' + name)
+
+# ==================================================================================================================
+# FUNCTIONS
+# ==================================================================================================================
+
+
+# function plays a complete game in a worker process
+# game_number picks who breaks (the first player on even games) and seeds the game so that it can be replayed
+# the shots simulated by the policies are looked up in the shot cache of the worker process, which is also kept in
+# shot_cache_path if it is given
+# returns the result of the game as a dictionary that can be written as JSON
+def play_game(game_number, players, engine, max_shots, seed, shot_cache_path=None):
+    random.seed(seed * 1000003 + game_number)
+    shot_cache = cached_engine(engine, shot_cache_path)
+    # the policy of each numbered player, player 1 breaks
+    order = players if game_number % 2 == 0 else players[::-1]
+    policies = [get_policy(name, shot_cache_path) for name in order]
+    table_state = TableState(racked_balls())
+    ball_colours = table_state.colours
+    game = GameState()
+    shots, fouls, frames = [0, 0], [0, 0], 0
+    break_outcome = None
+    start = time.perf_counter()
+    while game.winner is None and sum(shots) < max_shots:
+        player = game.player_turn
+        if game.cue_ball_in_hand:
+            balls = table_state.to_balls()
+            table_state.x[0], table_state.y[0] = place_cue_ball(balls, balls[0])
+            game = game.replace(cue_ball_in_hand=False)
+        # each policy is given its own copy of the table, so that nothing it does can move the balls of the game
+        cue_direction, strike_distance = policies[player - 1](table_state.clone(), game, engine)
+        result, table_state = simulate_table_shot(table_state, cue_direction % 360, strike_speed(strike_distance))
+        shots[player - 1] += 1
+        frames += result.frames
+        # the balls are left as the shot left them, a potted cue ball is taken back out of the pocket
+        table_state.set_potted(0, False)
+        game, events = resolve_turn(game, result.potted, result.first_ball_hit, ball_colours)
+        foul = game.cue_ball_in_hand and game.winner is None
+        if foul:
+            fouls[player - 1] += 1
+        if break_outcome is None:
+            break_outcome = {'potted': len([i for i in result.potted if i != 0]), 'foul': foul,
+                             'kept_turn': game.winner is None and game.player_turn == player,
+                             'eight_ball': any(ball_colours[i] == 'eight' for i in result.potted)}
+    # the new outcomes are written to the cache file after every game, the worker processes are terminated at the
+    # end of the run without closing their caches
+    shot_cache.flush()
+    return {'game': game_number, 'players': list(order), 'winner': None if game.winner is None else
+            order[game.winner - 1], 'winning_player': game.winner, 'shots': shots, 'fouls': fouls, 'frames': frames,
+            'break': break_outcome, 'seconds': time.perf_counter() - start}
+
+
+# function plays a game from a tuple of arguments, used by the worker processes
+def play_game_from_arguments(arguments):
+    return play_game(*arguments)
+
+
+# function returns the statistics of the games played so far
+def summarize(results, players, seconds):
+    games = len(results)
+    stats = {'games': games, 'seconds': seconds, 'draws': len([r for r in results if r['winner'] is None]),
+             'players': {}}
+    total_shots = sum(sum(r['shots']) for r in results)
+    stats['shots'] = total_shots
+    stats['shots_per_second'] = total_shots / seconds if seconds else 0
+    lengths = sorted(sum(r['shots']) for r in results)
+    stats['mean_game_shots'] = total_shots / games if games else 0
+    stats['median_game_shots'] = lengths[games // 2] if games else 0
+    # the players are counted by policy, so the breaking player is counted separately for games between equal policies
+    stats['breaker_win_rate'] = len([r for r in results if r['winning_player'] == 1]) / games if games else 0
+    for name in sorted(set(players)):
+        shots, fouls, wins, breaks = 0, 0, 0, []
+        for r in results:
+            for p in (0, 1):
+                if r['players'][p] == name:
+                    shots += r['shots'][p]
+                    fouls += r['fouls'][p]
+            if r['winner'] == name:
+                wins += 1
+            if r['players'][0] == name and r['break'] is not None:
+                breaks.append(r['break'])
+        stats['players'][name] = {
+            'wins': wins, 'win_rate': wins / games if games else 0,
+            'foul_rate': fouls / shots if shots else 0,
+            'break_wins': len([r for r in results if r['players'][0] == name and r['winner'] == name]),
+            'breaks': len(breaks),
+            'mean_balls_potted_on_break': sum(b['potted'] for b in breaks) / len(breaks) if breaks else 0,
+            'break_kept_turn_rate': len([b for b in breaks if b['kept_turn']]) / len(breaks) if breaks else 0,
+            'break_foul_rate': len([b for b in breaks if b['foul']]) / len(breaks) if breaks else 0}
+    return stats
+
+
+# function plays the games in worker processes, writing each result to the output file as it finishes
+# returns the statistics of the tournament
+def run(games, players, engine='step', processes=None, max_shots=MAX_SHOTS, output=None, seed=0, shot_cache_path=None):
+    arguments = [(n, tuple(players), engine, max_shots, seed, shot_cache_path) for n in range(games)]
+    results = []
+    f = open(output, 'w') if output is not None else None
+    pool = multiprocessing.Pool(processes)
+    start = time.perf_counter()
+    try:
+        for result in pool.imap_unordered(play_game_from_arguments, arguments):
+            results.append(result)
+            if f is not None:
+                f.write(json.dumps(result) + '\n')
+                f.flush()
+            if len(results) % PROGRESS_INTERVAL == 0:
+                stats = summarize(results, players, time.perf_counter() - start)
+                print('%d/%d games, %.1f shots/s, ' % (len(results), games, stats['shots_per_second']) +
+                      ', '.join('%s %.1f%%' % (name, p['win_rate'] * 100) for name, p in stats['players'].items()))
+    finally:
+        pool.terminate()
+        pool.join()
+        if f is not None:
+            f.close()
+    return summarize(results, players, time.perf_counter() - start)
+
+
+# function returns the statistics of the results written to a file by an earlier, possibly unfinished, run
+def load_results(path):
+    results = []
+    with open(path) as f:
+        for line in f:
+            # the last line of an interrupted run may be cut off
+            try:
+                results.append(json.loads(line))
+            except ValueError:
+                break
+    players = sorted(set(name for r in results for name in r['players']))
+    # the seconds of a finished run are not stored, so the shots per second are per core here
+    return summarize(results, players, sum(r['seconds'] for r in results))
+
+
+def main():
+    if '--summarize' in sys.argv:
+        print(json.dumps(load_results(option('--summarize')), indent=2, sort_keys=True))
+        return
+    players = option_values('--players', 2, PLAYERS)
+    for name in players:
+        get_policy(name)
+    stats = run(int(option('--games', GAMES)), players, option('--engine', 'step'),
+                int(option('--processes', 0)) or None, int(option('--max-shots', MAX_SHOTS)), option('--output'),
+                int(option('--seed', 0)), option('--shot-cache'))
+    print(json.dumps(stats, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
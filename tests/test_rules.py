@@ -0,0 +1,90 @@
+"""
+    File: test_rules.py
+    Author: Bob Wei
+    Date: 10/18/2026
+    Project Name: 8 Ball Pool
+    Description: Tests of the rules of the game on their own, without any physics. Each test resolves a single turn
+                 from a game state and the outcome of a shot
+                 Usage: python -m pytest tests   or   python -m unittest discover tests
+"""
+# ==================================================================================================================
+# IMPORT LIBRARIES
+# ==================================================================================================================
+import unittest
+from eightball.physics import RACK
+from eightball.rules import GameState, resolve_turn
+
+# ==================================================================================================================
+# CONSTANTS
+# ==================================================================================================================
+# colour of every ball of the rack: 0 is the cue ball, 1 to 7 solids, 8 the eight ball and 9 to 15 stripes
+BALL_COLOURS = tuple(colour for colour, x, y in RACK)
+SOLID, EIGHT, STRIPE = 1, 8, 9
+# a game after the break where player 1 has solids and player 2 has stripes
+OPEN_GAME = GameState(colours=('solids', 'stripes'), initial_break=False)
+# a game where player 1 has potted every solid and only has the eight ball left
+EIGHT_BALL_GAME = OPEN_GAME.replace(only_eight_ball_left=(True, False), potted=sum(1 << i for i in range(1, 8)))
+
+# ==================================================================================================================
+# TESTS
+# ==================================================================================================================
+
+
+class RulesTest (unittest.TestCase):
+    def test_break_without_contact_gives_ball_in_hand(self):
+        state, events = resolve_turn(GameState(), [], None, BALL_COLOURS)
+        self.assertEqual(state.player_turn, 2)
+        self.assertTrue(state.cue_ball_in_hand)
+        self.assertTrue(state.initial_break)
+        self.assertEqual(events, [('turn', 2), ('ball_in_hand', 2)])
+
+    def test_scratch_on_the_break_gives_ball_in_hand(self):
+        state, events = resolve_turn(GameState(), [0], SOLID, BALL_COLOURS)
+        self.assertEqual(state.player_turn, 2)
+        self.assertTrue(state.cue_ball_in_hand)
+
+    def test_first_ball_potted_assigns_the_colours(self):
+        state, events = resolve_turn(GameState(), [SOLID], SOLID, BALL_COLOURS)
+        self.assertEqual(state.colours, ('solids', 'stripes'))
+        self.assertFalse(state.initial_break)
+        self.assertEqual(state.player_turn, 1)
+        self.assertFalse(state.cue_ball_in_hand)
+        self.assertEqual(events, [('colours', 1, 'solids')])
+
+    def test_colours_assigned_to_the_second_player(self):
+        state, events = resolve_turn(GameState(player_turn=2), [STRIPE], STRIPE, BALL_COLOURS)
+        self.assertEqual(state.colours, ('solids', 'stripes'))
+        self.assertEqual(state.player_turn, 2)
+
+    def test_no_first_contact_gives_ball_in_hand(self):
+        state, events = resolve_turn(OPEN_GAME, [], None, BALL_COLOURS)
+        self.assertEqual(state.player_turn, 2)
+        self.assertTrue(state.cue_ball_in_hand)
+
+    def test_wrong_colour_first_gives_ball_in_hand(self):
+        state, events = resolve_turn(OPEN_GAME, [SOLID], STRIPE, BALL_COLOURS)
+        self.assertEqual(state.player_turn, 2)
+        self.assertTrue(state.cue_ball_in_hand)
+
+    def test_potting_the_eight_ball_early_loses(self):
+        state, events = resolve_turn(OPEN_GAME, [EIGHT], SOLID, BALL_COLOURS)
+        self.assertEqual(state.winner, 2)
+        self.assertEqual(events, [('win', 2)])
+
+    def test_potting_the_eight_ball_last_wins(self):
+        state, events = resolve_turn(EIGHT_BALL_GAME, [EIGHT], EIGHT, BALL_COLOURS)
+        self.assertEqual(state.winner, 1)
+
+    def test_scratch_on_the_eight_ball_loses(self):
+        state, events = resolve_turn(EIGHT_BALL_GAME, [EIGHT, 0], EIGHT, BALL_COLOURS)
+        self.assertEqual(state.winner, 2)
+
+    def test_resolving_a_turn_leaves_the_state_unchanged(self):
+        resolve_turn(OPEN_GAME, [SOLID, 0], STRIPE, BALL_COLOURS)
+        self.assertEqual(OPEN_GAME.player_turn, 1)
+        self.assertEqual(OPEN_GAME.potted, 0)
+        self.assertFalse(OPEN_GAME.cue_ball_in_hand)
+
+
+if __name__ == '__main__':
+    unittest.main()